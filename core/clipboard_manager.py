@@ -3,20 +3,118 @@
 Clipboard manager module for handling clipboard operations.
 Monitors and manages clipboard content across the system.
 """
+import hashlib
 import logging
+import os
+import queue
+import select
+import shutil
+import subprocess
+import sys
 import time
 import threading
-from typing import Callable, Dict, List, Optional, Any, Union
-import tkinter as tk
-from PIL import Image, ImageTk
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Any, Union
 import io
 
+# tkinter and PIL are imported on first use so text-only sessions skip them
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = logging.getLogger(__name__)
 
+# Optional native clipboard change notification backends
+try:
+    import win32api
+    import win32con
+    import win32gui
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
+try:
+    from AppKit import NSPasteboard
+    APPKIT_AVAILABLE = True
+except ImportError:
+    APPKIT_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from Xlib import display as xdisplay
+    from Xlib.ext import xfixes
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+# Not exposed by every pywin32 release
+WM_CLIPBOARDUPDATE = 0x031D
+
+# How long after a copy the poller keeps using the fast interval
+RECENT_ACTIVITY_SECONDS = 5.0
+
+# Number of decoded clipboard images kept around for reuse
+IMAGE_CACHE_SIZE = 8
+
+# Pending clipboard change notifications before the oldest ones are dropped
+DISPATCH_QUEUE_SIZE = 64
+
+# Images whose average hashes differ in at most this many bits are duplicates
+PHASH_DUPLICATE_DISTANCE = 5
+
+
+def content_digest(payload: bytes) -> int:
+    """
+    Compute a compact fingerprint of clipboard content
+    
+    Args:
+        payload: Raw content bytes
+        
+    Returns:
+        64-bit digest as an integer
+    """
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+
+
+def average_hash(image: "Image.Image") -> int:
+    """
+    Compute a 64-bit perceptual average hash of an image
+    
+    Args:
+        image: PIL image
+        
+    Returns:
+        Hash with one bit per pixel of an 8x8 grayscale thumbnail
+    """
+    from PIL import Image
+    
+    small = image.convert('L').resize((8, 8), Image.Resampling.BILINEAR)
+    
+    if NUMPY_AVAILABLE:
+        pixels = np.asarray(small, dtype=np.uint8)
+        return int.from_bytes(np.packbits(pixels > pixels.mean()).tobytes(), 'big')
+        
+    pixels = list(small.getdata())
+    mean = sum(pixels) / len(pixels)
+    result = 0
+    for pixel in pixels:
+        result = (result << 1) | (pixel > mean)
+    return result
+
+
 class ClipboardItem:
     """Represents a single clipboard item that can be text, image, or other data"""
     
-    def __init__(self, content: Any, content_type: str, timestamp: float = None):
+    def __init__(self, 
+                 content: Any, 
+                 content_type: str, 
+                 timestamp: float = None, 
+                 digest: Optional[int] = None, 
+                 phash: Optional[int] = None):
         """
         Initialize a clipboard item
         
@@ -24,10 +122,14 @@ class ClipboardItem:
             content: The actual content (text string, image data, etc.)
             content_type: Type of the content ('text', 'image', etc.)
             timestamp: When this item was created/copied
+            digest: Fingerprint of the raw content, see content_digest()
+            phash: Perceptual hash for images, see average_hash()
         """
         self.content = content
         self.content_type = content_type
         self.timestamp = timestamp or time.time()
+        self.digest = digest
+        self.phash = phash
         self.tags: List[str] = []
         self.favorite = False
         
@@ -48,47 +150,106 @@ class ClipboardManager:
     Provides methods to interact with the system clipboard.
     """
     
-    def __init__(self, max_history: int = 100):
+    def __init__(self, 
+                 max_history: int = 100, 
+                 fast_interval: float = 0.2, 
+                 slow_interval: float = 2.0, 
+                 undo_depth: Optional[int] = None):
         """
         Initialize the clipboard manager
         
         Args:
             max_history: Maximum number of items to keep in history
+            fast_interval: Poll interval (in seconds) while the UI is visible
+                or the user copied something recently
+            slow_interval: Poll interval (in seconds) while idle
+            undo_depth: Maximum number of undo/redo steps, defaults to max_history
         """
         self.max_history = max_history
-        self.history: List[ClipboardItem] = []
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.history: Deque[ClipboardItem] = deque(maxlen=max_history)
+        self._by_digest: Dict[int, ClipboardItem] = {}
         self.current_index = -1
+        import tkinter as tk
+        self._tk = tk
         self.clipboard = tk.Tk()
         self.clipboard.withdraw()  # Hide the window
         self.monitor_thread = None
-        self.stop_monitoring = threading.Event()
-        self.on_clipboard_change_callbacks: List[Callable[[ClipboardItem], None]] = []
+        self._stop_evt = threading.Event()
+        # Used as an ordered set: O(1) add/remove, registration order kept
+        self.on_clipboard_change_callbacks: Dict[Callable[[ClipboardItem], None], None] = {}
+        self.backend: Optional[str] = None
+        self._last_digest: Optional[int] = None
+        # Last text seen, so unchanged text can skip encoding and hashing
+        self._last_text: Optional[str] = None
+        self._last_len = -1
+        self._last_hash = 0
+        self._wake_backend: Optional[Callable[[], None]] = None
+        self._active = False
+        self._idle_since = time.monotonic()
+        self._last_type: Optional[str] = None
+        self._image_cache: Dict[int, Any] = OrderedDict()
+        self._dispatch_q: "queue.Queue[Optional[ClipboardItem]]" = queue.Queue(maxsize=DISPATCH_QUEUE_SIZE)
+        self.dispatch_thread = None
         
-        # For undo/redo functionality
-        self.undo_stack: List[ClipboardItem] = []
-        self.redo_stack: List[ClipboardItem] = []
+        # For undo/redo functionality, oldest steps are dropped once full
+        if undo_depth is None:
+            undo_depth = max_history
+        self.undo_stack: Deque[ClipboardItem] = deque(maxlen=undo_depth)
+        self.redo_stack: Deque[ClipboardItem] = deque(maxlen=undo_depth)
         
         logger.debug("ClipboardManager initialized")
         
-    def start_monitoring(self, interval: float = 0.5) -> None:
+    def start_monitoring(self, interval: Optional[float] = None, backend: str = 'auto') -> None:
         """
         Start monitoring the clipboard for changes
         
         Args:
-            interval: How often to check for changes (in seconds)
+            interval: How often to check for changes (in seconds) while active
+                when the backend has to poll, defaults to fast_interval
+            backend: Change notification backend to use ('auto', 'win32',
+                'macos', 'x11', 'wayland' or 'poll')
         """
         if self.monitor_thread is not None and self.monitor_thread.is_alive():
             logger.warning("Clipboard monitoring already active")
             return
             
-        self.stop_monitoring.clear()
+        if interval is None:
+            interval = self.fast_interval
+            
+        if backend == 'auto':
+            backend = self._detect_backend()
+            
+        targets = {
+            'win32': self._watch_win32,
+            'macos': self._watch_macos,
+            'x11': self._watch_x11,
+            'wayland': self._watch_wayland,
+            'poll': self._monitor_clipboard,
+        }
+        if backend not in targets:
+            logger.error(f"Unknown clipboard backend: {backend}")
+            return
+            
+        # Listeners run on their own thread so slow ones can't stall monitoring,
+        # it outlives monitor restarts and only stops in shutdown()
+        if self.dispatch_thread is None or not self.dispatch_thread.is_alive():
+            self.dispatch_thread = threading.Thread(
+                target=self._dispatch_changes,
+                daemon=True
+            )
+            self.dispatch_thread.start()
+            
+        self.backend = backend
+        self._stop_evt.clear()
         self.monitor_thread = threading.Thread(
-            target=self._monitor_clipboard,
+            target=targets[backend],
             args=(interval,),
             daemon=True
         )
         self.monitor_thread.start()
-        logger.info("Clipboard monitoring started")
+        logger.info(f"Clipboard monitoring started ({backend} backend)")
         
     def stop_monitoring(self) -> None:
         """Stop monitoring the clipboard"""
@@ -96,58 +257,377 @@ class ClipboardManager:
             logger.warning("Clipboard monitoring not active")
             return
             
-        self.stop_monitoring.set()
+        self._stop_evt.set()
+        if self._wake_backend:
+            try:
+                self._wake_backend()
+            except Exception as e:
+                logger.error(f"Error waking clipboard backend: {e}")
         self.monitor_thread.join(timeout=2.0)
         logger.info("Clipboard monitoring stopped")
         
+    def shutdown(self) -> None:
+        """Stop monitoring and the listener dispatcher, for application exit"""
+        if self.monitor_thread is not None and self.monitor_thread.is_alive():
+            self.stop_monitoring()
+            
+        # Let the dispatcher drain pending notifications and exit
+        if self.dispatch_thread is not None and self.dispatch_thread.is_alive():
+            self._enqueue_change(None)
+            self.dispatch_thread.join(timeout=2.0)
+        self.dispatch_thread = None
+        
+    def set_active(self, active: bool) -> None:
+        """
+        Tell the manager whether the history UI is currently visible
+        
+        Args:
+            active: True while the UI is shown, False when hidden
+        """
+        self._active = active
+        
+    def notify_activity(self) -> None:
+        """Mark the clipboard as recently used so polling stays fast"""
+        self._idle_since = time.monotonic()
+        
+    def _poll_interval(self, interval: float) -> float:
+        """
+        Compute how long to wait before the next clipboard check
+        
+        Args:
+            interval: Interval to use while active
+            
+        Returns:
+            Effective interval in seconds
+        """
+        if self._active or time.monotonic() - self._idle_since < RECENT_ACTIVITY_SECONDS:
+            effective = interval
+        else:
+            effective = max(interval, self.slow_interval)
+            
+        # Large media on the clipboard is expensive to read, back off further
+        if self._last_type == 'image':
+            effective *= 2
+            
+        return effective
+        
+    def _detect_backend(self) -> str:
+        """
+        Pick the best clipboard change notification backend for this system
+        
+        Returns:
+            Backend name, 'poll' if no native notifications are available
+        """
+        if sys.platform == 'win32' and WIN32_AVAILABLE:
+            return 'win32'
+        if sys.platform == 'darwin' and APPKIT_AVAILABLE:
+            return 'macos'
+        if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-paste'):
+            return 'wayland'
+        if os.environ.get('DISPLAY') and XLIB_AVAILABLE:
+            return 'x11'
+        return 'poll'
+        
     def _monitor_clipboard(self, interval: float) -> None:
         """
-        Monitor the clipboard for changes
+        Monitor the clipboard for changes by polling
         
         Args:
             interval: How often to check for changes (in seconds)
         """
-        last_content = None
+        self._last_digest = None
         
         try:
-            while not self.stop_monitoring.is_set():
-                try:
-                    # Try to get text content
-                    current_content = self.clipboard.clipboard_get()
-                    content_type = 'text'
-                except tk.TclError:
-                    try:
-                        # Try to get image content
-                        current_content = ImageTk.PhotoImage(self.clipboard.clipboard_get(type='image'))
-                        content_type = 'image'
-                    except (tk.TclError, Exception):
-                        current_content = None
-                        content_type = None
+            self._check_clipboard()
+            
+            # Wait before checking again; wakes immediately on shutdown
+            while not self._stop_evt.wait(timeout=self._poll_interval(interval)):
+                self._check_clipboard()
                 
-                # If we got content and it's different from the last one
-                if (current_content is not None and 
-                    (last_content is None or 
-                     (content_type == 'text' and current_content != last_content) or 
-                     (content_type == 'image'))):
-                    
-                    clip_item = ClipboardItem(current_content, content_type)
-                    self._add_to_history(clip_item)
+        except Exception as e:
+            logger.error(f"Error in clipboard monitoring thread: {e}")
+            
+    def _watch_win32(self, interval: float) -> None:
+        """
+        Wait for WM_CLIPBOARDUPDATE on a message-only window
+        
+        Args:
+            interval: Unused, the message loop blocks until an event arrives
+        """
+        import ctypes
+        
+        self._last_digest = None
+        hwnd = None
+        
+        def wndproc(hwnd, msg, wparam, lparam):
+            if msg == WM_CLIPBOARDUPDATE:
+                self._check_clipboard()
+                return 0
+            if msg == win32con.WM_CLOSE:
+                win32gui.DestroyWindow(hwnd)
+                return 0
+            if msg == win32con.WM_DESTROY:
+                win32gui.PostQuitMessage(0)
+                return 0
+            return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+            
+        try:
+            wc = win32gui.WNDCLASS()
+            wc.lpfnWndProc = wndproc
+            wc.lpszClassName = f"ClipScribeClipboardListener{id(self)}"
+            wc.hInstance = win32api.GetModuleHandle(None)
+            class_atom = win32gui.RegisterClass(wc)
+            
+            hwnd = win32gui.CreateWindowEx(
+                0, class_atom, "ClipScribe clipboard listener", 0,
+                0, 0, 0, 0, win32con.HWND_MESSAGE, 0, wc.hInstance, None
+            )
+            if not ctypes.windll.user32.AddClipboardFormatListener(hwnd):
+                raise OSError("AddClipboardFormatListener failed")
+                
+            self._wake_backend = lambda: win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+            
+            # Pick up whatever is on the clipboard right now
+            self._check_clipboard()
+            win32gui.PumpMessages()
+            
+            win32gui.UnregisterClass(class_atom, wc.hInstance)
+        except Exception as e:
+            logger.error(f"Error in win32 clipboard listener: {e}")
+        finally:
+            self._wake_backend = None
+            if hwnd and win32gui.IsWindow(hwnd):
+                ctypes.windll.user32.RemoveClipboardFormatListener(hwnd)
+                win32gui.DestroyWindow(hwnd)
+                
+    def _watch_macos(self, interval: float) -> None:
+        """
+        Watch NSPasteboard's change counter
+        
+        macOS has no clipboard change notification, but the change counter is
+        a cheap integer read so the clipboard is only fetched on real changes.
+        
+        Args:
+            interval: How often to read the change counter (in seconds)
+        """
+        self._last_digest = None
+        pasteboard = NSPasteboard.generalPasteboard()
+        last_count = None
+        
+        try:
+            while True:
+                count = pasteboard.changeCount()
+                if count != last_count:
+                    last_count = count
+                    self._check_clipboard()
                     
-                    # Notify callbacks
-                    for callback in self.on_clipboard_change_callbacks:
-                        try:
-                            callback(clip_item)
-                        except Exception as e:
-                            logger.error(f"Error in clipboard change callback: {e}")
+                if self._stop_evt.wait(timeout=self._poll_interval(interval)):
+                    break
+        except Exception as e:
+            logger.error(f"Error in macOS clipboard listener: {e}")
+            
+    def _watch_x11(self, interval: float) -> None:
+        """
+        Wait for XFixes selection owner notifications on CLIPBOARD
+        
+        Args:
+            interval: Unused, the listener blocks until an event arrives
+        """
+        self._last_digest = None
+        wake_r, wake_w = os.pipe()
+        disp = None
+        
+        try:
+            disp = xdisplay.Display()
+            disp.xfixes_query_version()
+            selection = disp.get_atom('CLIPBOARD')
+            disp.xfixes_select_selection_input(
+                disp.screen().root,
+                selection,
+                xfixes.XFixesSetSelectionOwnerNotifyMask
+            )
+            disp.flush()
+            
+            self._wake_backend = lambda: os.write(wake_w, b'\0')
+            
+            # Pick up whatever is on the clipboard right now
+            self._check_clipboard()
+            
+            while not self._stop_evt.is_set():
+                readable, _, _ = select.select([disp, wake_r], [], [])
+                if wake_r in readable:
+                    break
                     
-                    last_content = current_content if content_type == 'text' else None
+                changed = False
+                while disp.pending_events():
+                    event = disp.next_event()
+                    if (event.type, getattr(event, 'sub_code', None)) == \
+                            disp.extension_event.SetSelectionOwnerNotify:
+                        changed = True
+                        
+                if changed:
+                    self._check_clipboard()
+        except Exception as e:
+            logger.error(f"Error in X11 clipboard listener: {e}")
+        finally:
+            self._wake_backend = None
+            if disp is not None:
+                disp.close()
+            os.close(wake_r)
+            os.close(wake_w)
+            
+    def _watch_wayland(self, interval: float) -> None:
+        """
+        Use `wl-paste --watch` to get a line on stdout for every clipboard change
+        
+        Args:
+            interval: Unused, the listener blocks until an event arrives
+        """
+        self._last_digest = None
+        
+        try:
+            proc = subprocess.Popen(
+                ['wl-paste', '--watch', 'echo'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception as e:
+            logger.error(f"Error starting wl-paste: {e}")
+            return
+            
+        self._wake_backend = proc.terminate
+        
+        try:
+            for _ in proc.stdout:
+                if self._stop_evt.is_set():
+                    break
+                self._check_clipboard()
+        except Exception as e:
+            logger.error(f"Error in Wayland clipboard listener: {e}")
+        finally:
+            self._wake_backend = None
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
+            
+    def _check_clipboard(self) -> None:
+        """Read the clipboard and record it if it changed since the last check"""
+        raw = None
+        try:
+            # Try to get text content
+            current_content = self.clipboard.clipboard_get()
+            content_type = 'text'
+            # Length and cached str hash reject most changes without a full compare
+            if (self._last_digest is not None
+                    and len(current_content) == self._last_len
+                    and hash(current_content) == self._last_hash
+                    and current_content == self._last_text):
+                return
+            payload = current_content.encode('utf-8', 'surrogatepass')
+        except self._tk.TclError:
+            try:
+                # Try to get image content, decoded only once we know it changed
+                raw = self.clipboard.clipboard_get(type='image')
+                payload = raw if isinstance(raw, bytes) else raw.encode('utf-8', 'surrogatepass')
+                current_content = None
+                content_type = 'image'
+            except Exception:
+                return
+                
+        # Compare fingerprints rather than full payloads
+        digest = content_digest(payload)
+        if digest == self._last_digest:
+            return
+        self._last_digest = digest
+        if content_type == 'text':
+            self._last_text = current_content
+            self._last_len = len(current_content)
+            self._last_hash = hash(current_content)
+        else:
+            self._last_text = None
+            self._last_len = -1
+            
+        phash = None
+        if content_type == 'image':
+            current_content = self._decode_image(digest, raw)
+            if current_content is None:
+                return
+            try:
+                from PIL import Image
+                phash = average_hash(Image.open(io.BytesIO(payload)))
+            except Exception:
+                pass  # Not in a format PIL can read, exact dedup only
+                
+        clip_item = ClipboardItem(current_content, content_type, digest=digest, phash=phash)
+        self._add_to_history(clip_item)
+        self._last_type = content_type
+        self.notify_activity()
+        
+        # Hand off to the dispatcher thread to notify callbacks
+        self._enqueue_change(clip_item)
+        
+    def _enqueue_change(self, clip_item: Optional[ClipboardItem]) -> None:
+        """
+        Queue a change for the dispatcher, dropping the oldest if listeners lag
+        
+        Args:
+            clip_item: The new clipboard item, or None to stop the dispatcher
+        """
+        while True:
+            try:
+                self._dispatch_q.put_nowait(clip_item)
+                return
+            except queue.Full:
+                pass
                 
-                # Wait before checking again
-                time.sleep(interval)
+            # The newest clipboard state matters most, so make room for it
+            try:
+                self._dispatch_q.get_nowait()
+                logger.warning("Clipboard listeners are falling behind, dropping oldest change notification")
+            except queue.Empty:
+                pass
+            
+    def _dispatch_changes(self) -> None:
+        """Deliver queued clipboard changes to listeners until told to stop"""
+        while True:
+            clip_item = self._dispatch_q.get()
+            if clip_item is None:
+                break
                 
+            for callback in tuple(self.on_clipboard_change_callbacks):
+                try:
+                    callback(clip_item)
+                except Exception as e:
+                    logger.error(f"Error in clipboard change callback: {e}")
+                    
+    def _decode_image(self, digest: int, raw: Any) -> Optional[Any]:
+        """
+        Turn raw clipboard image data into a Tk image, reusing recent decodes
+        
+        Args:
+            digest: Fingerprint of the raw data
+            raw: Image data as returned by the clipboard
+            
+        Returns:
+            Tk-compatible image, or None if the data could not be decoded
+        """
+        image = self._image_cache.get(digest)
+        if image is not None:
+            self._image_cache.move_to_end(digest)
+            return image
+            
+        try:
+            from PIL import ImageTk
+            image = ImageTk.PhotoImage(raw)
         except Exception as e:
-            logger.error(f"Error in clipboard monitoring thread: {e}")
+            logger.debug(f"Could not decode clipboard image: {e}")
+            return None
             
+        self._image_cache[digest] = image
+        if len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+        return image
+        
     def _add_to_history(self, item: ClipboardItem) -> None:
         """
         Add an item to clipboard history
@@ -158,14 +638,75 @@ class ClipboardManager:
         # Clear redo stack when new item is added
         self.redo_stack.clear()
         
-        # Add to history and maintain max size
+        # Copying something already in history moves it to the end
+        existing = None
+        if item.digest is not None:
+            existing = self._by_digest.get(item.digest)
+        if existing is None and item.phash is not None:
+            existing = self._find_similar_image(item.phash)
+            
+        if existing is not None:
+            if self._by_digest.get(existing.digest) is existing:
+                del self._by_digest[existing.digest]
+            item.tags = existing.tags
+            item.favorite = existing.favorite
+            try:
+                self.history.remove(existing)
+            except ValueError:
+                pass  # Already deleted from history
+                
+        # The deque drops the oldest item on append once full
+        if self.history and len(self.history) == self.history.maxlen:
+            evicted = self.history[0]
+            if self._by_digest.get(evicted.digest) is evicted:
+                del self._by_digest[evicted.digest]
+                
         self.history.append(item)
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        if item.digest is not None:
+            self._by_digest[item.digest] = item
             
         # Update current index
         self.current_index = len(self.history) - 1
         
+    def remove_item(self, item: ClipboardItem) -> bool:
+        """
+        Remove an item from history
+        
+        Args:
+            item: The clipboard item to remove
+            
+        Returns:
+            bool: True if the item was in history
+        """
+        try:
+            self.history.remove(item)
+        except ValueError:
+            return False
+            
+        # Drop the digest entry too, or copying the same content again would
+        # revive the deleted item's tags and keep its payload alive
+        if self._by_digest.get(item.digest) is item:
+            del self._by_digest[item.digest]
+            
+        self.current_index = min(self.current_index, len(self.history) - 1)
+        return True
+        
+    def _find_similar_image(self, phash: int) -> Optional[ClipboardItem]:
+        """
+        Find a near-duplicate image in history
+        
+        Args:
+            phash: Average hash of the new image
+            
+        Returns:
+            The most recent image within PHASH_DUPLICATE_DISTANCE, or None
+        """
+        for other in reversed(self.history):
+            if (other.phash is not None and 
+                bin(other.phash ^ phash).count('1') <= PHASH_DUPLICATE_DISTANCE):
+                return other
+        return None
+        
     def copy_to_clipboard(self, item: ClipboardItem) -> None:
         """
         Copy an item to the system clipboard
@@ -224,8 +765,7 @@ class ClipboardManager:
         Args:
             callback: The function to call when clipboard changes
         """
-        if callback not in self.on_clipboard_change_callbacks:
-            self.on_clipboard_change_callbacks.append(callback)
+        self.on_clipboard_change_callbacks[callback] = None
             
     def remove_clipboard_change_listener(self, callback: Callable[[ClipboardItem], None]) -> None:
         """
@@ -234,5 +774,4 @@ class ClipboardManager:
         Args:
             callback: The callback function to remove
         """
-        if callback in self.on_clipboard_change_callbacks:
-            self.on_clipboard_change_callbacks.remove(callback)
+        self.on_clipboard_change_callbacks.pop(callback, None)
@@ -3,9 +3,10 @@
 Global hotkeys management module.
 Provides functionality to register and handle global keyboard shortcuts.
 """
+import functools
 import logging
-import threading
-from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 # We'll use pynput for cross-platform global hotkey handling
 try:
@@ -25,10 +26,10 @@ class HotkeyManager:
     
     def __init__(self):
         """Initialize hotkey manager"""
-        self.hotkeys: Dict[str, Tuple[Callable, str]] = {}
-        self.listener: Optional[keyboard.Listener] = None
+        self.hotkeys: Dict[FrozenSet[str], Tuple[Callable, str]] = {}
+        self.listener: Optional[keyboard.GlobalHotKeys] = None
         self.active = False
-        self.current_keys = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
         
     def start(self) -> bool:
         """
@@ -46,11 +47,9 @@ class HotkeyManager:
             return True
             
         try:
-            self.listener = keyboard.Listener(
-                on_press=self._on_press,
-                on_release=self._on_release
-            )
-            self.listener.start()
+            # Callbacks run on a small pool so auto-repeat doesn't spawn threads
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='hotkey')
+            self._start_listener()
             self.active = True
             logger.info("Global hotkey listener started")
             return True
@@ -62,73 +61,78 @@ class HotkeyManager:
         """Stop listening for hotkeys"""
         if self.listener and self.active:
             self.listener.stop()
+            self.listener = None
             self.active = False
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             logger.info("Global hotkey listener stopped")
             
-    def _on_press(self, key) -> None:
-        """
-        Handle key press events
+    def _start_listener(self) -> None:
+        """Create and start a pynput listener for the current hotkey map"""
+        mapping = {}
+        for key_combo, (callback, description) in self.hotkeys.items():
+            hotkey = self._combo_to_string(key_combo)
+            pynput_combo = self._to_pynput(key_combo)
+            
+            # One bad combo must not take every other hotkey down with it
+            try:
+                keyboard.HotKey.parse(pynput_combo)
+            except ValueError as e:
+                logger.error(f"Skipping unrecognized hotkey {hotkey}: {str(e)}")
+                continue
+                
+            mapping[pynput_combo] = functools.partial(
+                self._dispatch, callback, hotkey, description
+            )
+            
+        self.listener = keyboard.GlobalHotKeys(mapping)
+        self.listener.start()
         
-        Args:
-            key: The key that was pressed
-        """
+    def _restart_listener(self) -> None:
+        """Rebuild the listener after the hotkey map changed"""
+        if not self.active:
+            return
+            
         try:
-            # Convert key to string representation
-            key_str = self._key_to_string(key)
-            if key_str:
-                self.current_keys.add(key_str)
-                
-                # Check if current combination matches any hotkey
-                current_combo = "+".join(sorted(self.current_keys))
-                if current_combo in self.hotkeys:
-                    callback, description = self.hotkeys[current_combo]
-                    logger.debug(f"Hotkey triggered: {current_combo} ({description})")
-                    
-                    # Run callback in a separate thread to avoid blocking
-                    threading.Thread(
-                        target=self._run_callback,
-                        args=(callback, current_combo),
-                        daemon=True
-                    ).start()
+            if self.listener:
+                self.listener.stop()
+            self._start_listener()
         except Exception as e:
-            logger.error(f"Error handling key press: {str(e)}")
+            logger.error(f"Failed to restart hotkey listener: {str(e)}")
             
-    def _on_release(self, key) -> None:
+    def _dispatch(self, callback: Callable, hotkey: str, description: str) -> None:
         """
-        Handle key release events
+        Handle a hotkey activation from the listener thread
         
         Args:
-            key: The key that was released
+            callback: The function to call
+            hotkey: The hotkey string that was activated
+            description: Human-readable description of the hotkey
         """
-        try:
-            key_str = self._key_to_string(key)
-            if key_str and key_str in self.current_keys:
-                self.current_keys.remove(key_str)
-        except Exception as e:
-            logger.error(f"Error handling key release: {str(e)}")
+        logger.debug(f"Hotkey triggered: {hotkey} ({description})")
+        
+        # Run callback off the listener thread to avoid blocking
+        if self._executor:
+            self._executor.submit(self._run_callback, callback, hotkey)
             
-    def _key_to_string(self, key) -> Optional[str]:
+    @staticmethod
+    def _to_pynput(key_combo: FrozenSet[str]) -> str:
         """
-        Convert a pynput key to string representation
+        Convert a normalized key combination to pynput's hotkey syntax
         
         Args:
-            key: The key object from pynput
+            key_combo: Normalized key combination
             
         Returns:
-            String representation of the key, or None if conversion failed
+            pynput hotkey string (e.g., '<ctrl>+<shift>+c')
         """
-        if key is None:
-            return None
-            
-        try:
-            if isinstance(key, keyboard.Key):
-                return key.name
-            else:
-                # For regular keys, get the character
-                return key.char
-        except Exception:
-            return None
-            
+        # Modifiers and named keys go in angle brackets, characters stay bare
+        return "+".join(
+            part if len(part) == 1 else f"<{part}>"
+            for part in sorted(key_combo)
+        )
+        
     def _run_callback(self, callback: Callable, hotkey: str) -> None:
         """
         Run a hotkey callback safely
@@ -164,11 +168,19 @@ class HotkeyManager:
         # Normalize key combination
         key_combo = self._normalize_key_combo(keys)
         
+        # Reject combos pynput can't parse, GlobalHotKeys would fail on all of them
+        try:
+            keyboard.HotKey.parse(self._to_pynput(key_combo))
+        except ValueError as e:
+            logger.error(f"Cannot register hotkey {keys}: {str(e)}")
+            return False
+            
         if key_combo in self.hotkeys:
-            logger.warning(f"Hotkey {key_combo} already registered, overwriting")
+            logger.warning(f"Hotkey {keys} already registered, overwriting")
             
         self.hotkeys[key_combo] = (callback, description)
-        logger.info(f"Registered hotkey: {key_combo} ({description})")
+        self._restart_listener()
+        logger.info(f"Registered hotkey: {keys} ({description})")
         return True
         
     def unregister_hotkey(self, keys: str) -> bool:
@@ -185,13 +197,16 @@ class HotkeyManager:
         
         if key_combo in self.hotkeys:
             del self.hotkeys[key_combo]
-            logger.info(f"Unregistered hotkey: {key_combo}")
+            self._restart_listener()
+            logger.info(f"Unregistered hotkey: {keys}")
             return True
         else:
-            logger.warning(f"Cannot unregister hotkey {key_combo}: not found")
+            logger.warning(f"Cannot unregister hotkey {keys}: not found")
             return False
             
-    def _normalize_key_combo(self, keys: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_key_combo(keys: str) -> FrozenSet[str]:
         """
         Normalize a key combination string
         
@@ -199,11 +214,22 @@ class HotkeyManager:
             keys: Input key combination (e.g., 'Ctrl+C', 'shift + alt + T')
             
         Returns:
-            Normalized key combination (e.g., 'ctrl+c', 'alt+shift+t')
+            Set of lower-cased key names (e.g., {'ctrl', 'c'})
+        """
+        return frozenset(part.strip().lower() for part in keys.split("+"))
+        
+    @staticmethod
+    def _combo_to_string(key_combo: FrozenSet[str]) -> str:
+        """
+        Format a normalized key combination for display
+        
+        Args:
+            key_combo: Normalized key combination
+            
+        Returns:
+            Sorted, '+'-joined key names (e.g., 'alt+shift+t')
         """
-        # Split by '+', strip whitespace, convert to lowercase, and sort
-        parts = [part.strip().lower() for part in keys.split("+")]
-        return "+".join(sorted(parts))
+        return "+".join(sorted(key_combo))
         
     def get_registered_hotkeys(self) -> Dict[str, str]:
         """
@@ -212,4 +238,4 @@ class HotkeyManager:
         Returns:
             Dictionary of hotkey combinations and descriptions
         """
-        return {k: v[1] for k, v in self.hotkeys.items()}
+        return {self._combo_to_string(k): v[1] for k, v in self.hotkeys.items()}
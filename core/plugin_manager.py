@@ -2,15 +2,29 @@
 """
 Plugin manager for loading and managing ClipScribe plugins.
 """
+import functools
 import importlib.util
 import inspect
 import logging
 import os
 import sys
-from typing import Dict, List, Optional, Type, Any, Callable
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import EntryPoint, entry_points
+from typing import Dict, List, Optional, Tuple, Type, Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# Entry point group installed packages use to register Plugin subclasses
+ENTRY_POINT_GROUP = "clipscribe.plugins"
+
+# Number of (item, plugin set) action lists kept by get_item_actions
+ITEM_ACTIONS_CACHE_SIZE = 256
+
+# Validated plugin item action, the callback receives the clipboard item
+PluginAction = namedtuple("PluginAction", "label callback")
+
 class Plugin:
     """Base class for all plugins"""
     
@@ -59,6 +73,19 @@ class Plugin:
         """
         pass
         
+    def get_item_actions(self, item_id: str) -> List[Dict[str, Any]]:
+        """
+        Actions this plugin offers for a clipboard item
+        
+        Args:
+            item_id: ID of the clipboard item
+            
+        Returns:
+            List of action dictionaries with "label" and "callback" keys,
+            the callback receives the clipboard item
+        """
+        return []
+        
     def on_shutdown(self) -> None:
         """Called when the application is shutting down"""
         pass
@@ -81,6 +108,29 @@ class PluginManager:
         self.plugin_dir = plugin_dir
         self.plugins: Dict[str, Plugin] = {}
         self.enabled_plugins: Dict[str, Plugin] = {}
+        self._entry_points: Dict[str, EntryPoint] = {}
+        self._by_name: Dict[str, Plugin] = {}
+        
+        # Bumped whenever the set of enabled plugins changes, part of the
+        # item action cache key so stale actions are never served
+        self._version = 0
+        
+        # Enabled plugins that override Plugin.get_item_actions
+        self._action_providers: Dict[str, Plugin] = {}
+        self.get_item_actions_cached = functools.lru_cache(maxsize=ITEM_ACTIONS_CACHE_SIZE)(
+            self._collect_item_actions
+        )
+        
+        # Serializes module execution when plugins load in parallel
+        self._load_lock = threading.Lock()
+        
+        # Guards the enabled plugin bookkeeping and _version, plugins may be
+        # enabled from several threads at startup
+        self._state_lock = threading.Lock()
+        
+        # Plugin directory scan, reused until the directory changes
+        self._last_scan_mtime: Optional[float] = None
+        self._discovered_cache: List[str] = []
         
         # Ensure plugin directory exists
         os.makedirs(plugin_dir, exist_ok=True)
@@ -92,14 +142,30 @@ class PluginManager:
         Returns:
             List of plugin module names
         """
-        discovered = []
-        
-        # Get all Python files in the plugin directory
         try:
-            for file in os.listdir(self.plugin_dir):
-                if file.endswith(".py") and not file.startswith("_"):
-                    module_name = file[:-3]  # Remove .py extension
-                    discovered.append(module_name)
+            # Only the directory scan is cached, it is redone when the
+            # directory changes
+            mtime = os.stat(self.plugin_dir).st_mtime
+            if mtime != self._last_scan_mtime:
+                # Get all Python files in the plugin directory
+                with os.scandir(self.plugin_dir) as entries:
+                    self._discovered_cache = [
+                        entry.name[:-3]  # Remove .py extension
+                        for entry in entries
+                        if entry.name.endswith(".py")
+                        and not entry.name.startswith("_")
+                        and entry.is_file(follow_symlinks=False)
+                    ]
+                self._last_scan_mtime = mtime
+                
+            discovered = list(self._discovered_cache)
+            
+            # Add plugins registered by installed packages, queried every time
+            # since installing or removing a package doesn't touch plugin_dir
+            self._entry_points = self._discover_entry_points()
+            for name in self._entry_points:
+                if name not in discovered:
+                    discovered.append(name)
                     
             logger.info(f"Discovered {len(discovered)} plugins: {', '.join(discovered)}")
             return discovered
@@ -107,6 +173,47 @@ class PluginManager:
             logger.error(f"Error discovering plugins: {str(e)}")
             return []
             
+    def _discover_entry_points(self) -> Dict[str, EntryPoint]:
+        """
+        Find plugins registered under the ClipScribe entry point group
+        
+        Returns:
+            Dictionary of plugin names and their entry points
+        """
+        try:
+            eps = entry_points()
+            if hasattr(eps, "select"):
+                eps = eps.select(group=ENTRY_POINT_GROUP)
+            else:
+                # Python < 3.10 returns a dict of groups
+                eps = eps.get(ENTRY_POINT_GROUP, [])
+            return {ep.name: ep for ep in eps}
+        except Exception as e:
+            logger.error(f"Error reading plugin entry points: {str(e)}")
+            return {}
+            
+    def _find_plugin_class(self, module) -> Optional[Type[Plugin]]:
+        """
+        Find the Plugin subclass provided by a plugin module
+        
+        Args:
+            module: The loaded plugin module
+            
+        Returns:
+            Plugin class if found, None otherwise
+        """
+        # Plugins can name their class directly and skip the module scan
+        plugin_class = getattr(module, "PLUGIN_CLASS", None)
+        if plugin_class is not None:
+            return plugin_class
+            
+        for name, obj in inspect.getmembers(module):
+            if (inspect.isclass(obj) and 
+                issubclass(obj, Plugin) and 
+                obj is not Plugin):
+                return obj
+        return None
+        
     def load_plugin(self, module_name: str) -> Optional[Plugin]:
         """
         Load a plugin by module name
@@ -123,6 +230,11 @@ class PluginManager:
                 logger.info(f"Plugin {module_name} already loaded")
                 return self.plugins[module_name]
                 
+            entry_point = self._entry_points.get(module_name)
+            if entry_point is not None:
+                # Entry points resolve straight to the plugin class
+                return self._instantiate(module_name, entry_point.load())
+                
             # Build the full path to the plugin file
             plugin_path = os.path.join(self.plugin_dir, f"{module_name}.py")
             
@@ -137,33 +249,40 @@ class PluginManager:
                 return None
                 
             module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            with self._load_lock:
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
             
             # Find the Plugin class in the module
-            plugin_class = None
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Plugin) and 
-                    obj is not Plugin):
-                    plugin_class = obj
-                    break
-                    
+            plugin_class = self._find_plugin_class(module)
             if not plugin_class:
                 logger.error(f"No Plugin class found in {module_name}")
                 return None
                 
-            # Create plugin instance
-            plugin = plugin_class(self.app)
-            self.plugins[module_name] = plugin
-            
-            logger.info(f"Loaded plugin: {plugin.name} v{plugin.version} by {plugin.author}")
-            return plugin
+            return self._instantiate(module_name, plugin_class)
             
         except Exception as e:
             logger.error(f"Failed to load plugin {module_name}: {str(e)}")
             return None
             
+    def _instantiate(self, module_name: str, plugin_class: Type[Plugin]) -> Plugin:
+        """
+        Create and register a plugin instance
+        
+        Args:
+            module_name: Name the plugin is registered under
+            plugin_class: The Plugin subclass to instantiate
+            
+        Returns:
+            The new plugin instance
+        """
+        plugin = plugin_class(self.app)
+        self.plugins[module_name] = plugin
+        self._by_name[plugin.name] = plugin
+        
+        logger.info(f"Loaded plugin: {plugin.name} v{plugin.version} by {plugin.author}")
+        return plugin
+        
     def enable_plugin(self, module_name: str) -> bool:
         """
         Enable a plugin
@@ -187,7 +306,11 @@ class PluginManager:
         try:
             success = plugin.enable()
             if success:
-                self.enabled_plugins[module_name] = plugin
+                with self._state_lock:
+                    self.enabled_plugins[module_name] = plugin
+                    if type(plugin).get_item_actions is not Plugin.get_item_actions:
+                        self._action_providers[module_name] = plugin
+                    self._version += 1
                 logger.info(f"Enabled plugin: {plugin.name}")
             else:
                 logger.warning(f"Plugin {plugin.name} refused to enable")
@@ -222,7 +345,10 @@ class PluginManager:
         try:
             success = plugin.disable()
             if success:
-                del self.enabled_plugins[module_name]
+                with self._state_lock:
+                    del self.enabled_plugins[module_name]
+                    self._action_providers.pop(module_name, None)
+                    self._version += 1
                 logger.info(f"Disabled plugin: {plugin.name}")
             else:
                 logger.warning(f"Plugin {plugin.name} refused to disable")
@@ -232,6 +358,33 @@ class PluginManager:
             logger.error(f"Error disabling plugin {plugin.name}: {str(e)}")
             return False
             
+    def unload_plugin(self, module_name: str) -> bool:
+        """
+        Unload a plugin, disabling it first if needed
+        
+        Args:
+            module_name: Name of the plugin module
+            
+        Returns:
+            bool: True if unloaded successfully, False otherwise
+        """
+        plugin = self.plugins.get(module_name)
+        
+        if not plugin:
+            logger.warning(f"Cannot unload plugin {module_name}: not loaded")
+            return False
+            
+        if module_name in self.enabled_plugins and not self.disable_plugin(module_name):
+            logger.error(f"Cannot unload plugin {plugin.name}: failed to disable")
+            return False
+            
+        del self.plugins[module_name]
+        if self._by_name.get(plugin.name) is plugin:
+            del self._by_name[plugin.name]
+            
+        logger.info(f"Unloaded plugin: {plugin.name}")
+        return True
+        
     def load_all_plugins(self) -> Dict[str, Optional[Plugin]]:
         """
         Discover and load all plugins
@@ -240,13 +393,16 @@ class PluginManager:
             Dictionary of module names and loaded plugin instances
         """
         modules = self.discover_plugins()
-        result = {}
-        
-        for module_name in modules:
-            plugin = self.load_plugin(module_name)
-            result[module_name] = plugin
+        if not modules:
+            return {}
             
-        return result
+        # Overlap the file reads of independent plugins
+        with ThreadPoolExecutor(max_workers=min(8, len(modules))) as executor:
+            futures = {executor.submit(self.load_plugin, m): m for m in modules}
+            loaded = {futures[f]: f.result() for f in as_completed(futures)}
+            
+        # Keep discovery order in the result
+        return {module_name: loaded[module_name] for module_name in modules}
         
     def enable_all_plugins(self) -> Dict[str, bool]:
         """
@@ -272,10 +428,52 @@ class PluginManager:
         Returns:
             Plugin instance if found, None otherwise
         """
-        for plugin in self.plugins.values():
-            if plugin.name == name:
-                return plugin
-        return None
+        return self._by_name.get(name)
+        
+    def has_item_action_providers(self) -> bool:
+        """
+        Check whether any enabled plugin offers item actions
+        
+        Returns:
+            bool: True if at least one enabled plugin overrides get_item_actions
+        """
+        return bool(self._action_providers)
+        
+    def get_item_actions(self, item_id: str) -> Tuple[PluginAction, ...]:
+        """
+        Collect the actions enabled plugins offer for a clipboard item
+        
+        Args:
+            item_id: ID of the clipboard item
+            
+        Returns:
+            Tuple of PluginAction, cached per item and plugin set
+        """
+        return self.get_item_actions_cached(item_id, self._version)
+        
+    def _collect_item_actions(self, item_id: str, version: int) -> Tuple[PluginAction, ...]:
+        """
+        Ask every enabled plugin for its item actions
+        
+        Args:
+            item_id: ID of the clipboard item
+            version: Plugin set version, only used as part of the cache key
+            
+        Returns:
+            Tuple of PluginAction, actions without a callable callback are dropped
+        """
+        actions = []
+        for plugin in list(self._action_providers.values()):
+            try:
+                for action in plugin.get_item_actions(item_id):
+                    callback = action.get("callback")
+                    if callable(callback):
+                        actions.append(PluginAction(action.get("label", "Action"), callback))
+                    else:
+                        logger.warning(f"Plugin {plugin.name} returned an action without a callback")
+            except Exception as e:
+                logger.error(f"Error in plugin {plugin.name} get_item_actions: {str(e)}")
+        return tuple(actions)
         
     def notify_clipboard_change(self, item) -> None:
         """
@@ -2,15 +2,49 @@
 """
 Settings management module for storing and retrieving application settings.
 """
+import atexit
+import copy
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional, List
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, List, Tuple
+
+# orjson is much faster at (de)serializing, fall back to stdlib json without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+    _loads = json.loads
+
+# Delay before a scheduled save is written, so bursts coalesce into one write
+SAVE_DELAY_SECONDS = 0.5
+
+# Note changes are appended to this file (next to the settings file) and folded
+# into a full settings write at startup, exit, or once the log outgrows the
+# settings file by this factor
+NOTES_LOG_NAME = "notes.log"
+NOTES_LOG_COMPACT_RATIO = 10
+
 DEFAULT_SETTINGS = {
     "general": {
         "max_history_items": 100,
@@ -55,10 +89,18 @@ DEFAULT_SETTINGS = {
     },
     "notes": {
         "items": [],
-        "sticky_items": []
+        "sticky_items": [],
+        # Sequence number of the last logged note operation this file includes
+        "log_seq": 0
     }
 }
 
+# Shared read-only fallback for missing sections, avoids allocating a dict per miss
+_EMPTY = MappingProxyType({})
+
+# Pristine copy of the defaults; only ever deep-copied, never handed out
+_FROZEN_DEFAULTS = copy.deepcopy(DEFAULT_SETTINGS)
+
 
 class Settings:
     """
@@ -74,33 +116,70 @@ class Settings:
         """
         self.settings_file = settings_file
         self.settings = {}
+        
+        # Create the settings directory once rather than on every load/save
+        try:
+            os.makedirs(os.path.dirname(settings_file) or '.', exist_ok=True)
+        except OSError as e:
+            logger.error(f"Error creating settings directory: {str(e)}")
+            
+        # Note id -> (list name in the notes section, position in that list)
+        self._note_index: Dict[str, Tuple[str, int]] = {}
+        
+        # (section, key) -> value view of self.settings for get()
+        self._flat: Dict[Tuple[str, str], Any] = {}
+        self._flat_lock = threading.Lock()
+        
+        # Debounced saving state
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._last_saved_hash: Optional[bytes] = None
+        self._snapshot_size = 0
+        atexit.register(self._flush)
+        
+        # Append-only log of note operations since the last full save
+        self._notes_log_path = os.path.join(os.path.dirname(settings_file), NOTES_LOG_NAME)
+        self._notes_log = None
+        self._notes_log_size = 0
+        self._notes_seq = 0
+        
         self.load()
         
     def load(self) -> None:
         """Load settings from file or create with defaults if not exists"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-            
             # Try to load from file
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    raw = f.read()
+                loaded = _loads(raw)
+                self._last_saved_hash = hashlib.blake2b(raw, digest_size=16).digest()
+                self._snapshot_size = len(raw)
                     
                 # Merge with defaults to ensure all needed settings exist
-                self._merge_settings(DEFAULT_SETTINGS, loaded)
+                self._merge_settings(_FROZEN_DEFAULTS, loaded)
                 logger.info("Settings loaded from file")
             else:
                 # Use defaults
-                self.settings = DEFAULT_SETTINGS.copy()
+                self.settings = copy.deepcopy(_FROZEN_DEFAULTS)
                 self.save()  # Create the file
                 logger.info("Created new settings file with defaults")
                 
         except Exception as e:
             logger.error(f"Error loading settings: {str(e)}")
             logger.info("Using default settings")
-            self.settings = DEFAULT_SETTINGS.copy()
+            self.settings = copy.deepcopy(_FROZEN_DEFAULTS)
+            
+        self._rebuild_note_index()
+        
+        # Bring in note changes logged after the last full save, then compact
+        if self._replay_notes_log():
+            self.save()
+        self._notes_seq = self.settings.get("notes", {}).get("log_seq", 0)
             
+        self._rebuild_flat()
+        
     def save(self) -> bool:
         """
         Save current settings to file
@@ -108,19 +187,59 @@ class Settings:
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-            
-            # Write settings to file
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+        with self._save_lock:
+            # A direct save supersedes any pending scheduled one
+            self._dirty = False
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
                 
-            logger.info("Settings saved to file")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving settings: {str(e)}")
-            return False
+            try:
+                data = _dumps(self.settings)
+                
+                # Nothing to do if the file already holds exactly these bytes
+                data_hash = hashlib.blake2b(data, digest_size=16).digest()
+                if data_hash == self._last_saved_hash:
+                    self._truncate_notes_log()
+                    return True
+                    
+                # Write to a temporary file and swap it in atomically
+                tmp_file = self.settings_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.settings_file)
+                self._last_saved_hash = data_hash
+                self._snapshot_size = len(data)
+                
+                # The file now includes every logged note operation
+                self._truncate_notes_log()
+                
+                logger.info("Settings saved to file")
+                return True
+            except Exception as e:
+                # Keep the changes pending so the exit flush retries them
+                self._dirty = True
+                logger.error(f"Error saving settings: {str(e)}")
+                return False
+                
+    def schedule_save(self) -> None:
+        """
+        Mark settings as changed and save them shortly in the background
+        
+        Repeated calls within SAVE_DELAY_SECONDS result in a single write.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            
+    def _flush(self) -> None:
+        """Write settings to file if there are unsaved changes"""
+        if self._dirty:
+            self.save()
             
     def _merge_settings(self, default: Dict, loaded: Dict) -> None:
         """
@@ -130,17 +249,46 @@ class Settings:
             default: Default settings dictionary
             loaded: Loaded settings dictionary
         """
-        self.settings = default.copy()
+        self.settings = copy.deepcopy(default)
         
-        for key, value in loaded.items():
-            if key in self.settings and isinstance(self.settings[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                for subkey, subvalue in value.items():
-                    if subkey in self.settings[key]:
-                        self.settings[key][subkey] = subvalue
-            else:
-                self.settings[key] = value
+        # Walk (destination, source) dict pairs with an explicit stack. Unknown
+        # top-level sections are kept; inside sections only known keys are taken.
+        stack = [(self.settings, loaded, True)]
+        while stack:
+            dst, src, keep_unknown = stack.pop()
+            for key, value in src.items():
+                if key in dst:
+                    if type(dst[key]) is dict and type(value) is dict:
+                        stack.append((dst[key], value, False))
+                    else:
+                        # Lists (e.g. notes) are adopted as loaded, not copied
+                        dst[key] = value
+                elif keep_unknown:
+                    dst[key] = value
+                
+    def _rebuild_flat(self, section: Optional[str] = None) -> None:
+        """
+        Rebuild the flat lookup view of the settings
+        
+        Args:
+            section: Only rebuild entries for this section, or None for all
+        """
+        with self._flat_lock:
+            if section is None:
+                self._flat = {
+                    (name, key): value
+                    for name, values in self.settings.items() if isinstance(values, dict)
+                    for key, value in values.items()
+                }
+                return
                 
+            for flat_key in [k for k in self._flat if k[0] == section]:
+                del self._flat[flat_key]
+            values = self.settings.get(section)
+            if isinstance(values, dict):
+                for key, value in values.items():
+                    self._flat[(section, key)] = value
+                    
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
         Get a setting value
@@ -153,10 +301,8 @@ class Settings:
         Returns:
             Setting value or default if not found
         """
-        try:
-            return self.settings.get(section, {}).get(key, default)
-        except Exception:
-            return default
+        # A single dict lookup is atomic, writers hold _flat_lock
+        return self._flat.get((section, key), default)
             
     def set(self, section: str, key: str, value: Any) -> None:
         """
@@ -167,12 +313,29 @@ class Settings:
             key: Setting key name
             value: Value to set
         """
-        if section not in self.settings:
-            self.settings[section] = {}
-            
-        self.settings[section][key] = value
+        # _save_lock keeps a background save from serializing mid-change
+        with self._save_lock, self._flat_lock:
+            if section not in self.settings:
+                self.settings[section] = {}
+                
+            self.settings[section][key] = value
+            self._flat[(section, key)] = value
+        
+    def update(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Set several setting values at once
         
-    def get_section(self, section: str) -> Dict:
+        Args:
+            updates: Section name -> {key: value} of the settings to set
+        """
+        with self._save_lock, self._flat_lock:
+            for section, values in updates.items():
+                target = self.settings.setdefault(section, {})
+                for key, value in values.items():
+                    target[key] = value
+                    self._flat[(section, key)] = value
+                    
+    def get_section(self, section: str) -> Mapping[str, Any]:
         """
         Get an entire settings section
         
@@ -180,9 +343,9 @@ class Settings:
             section: Section name
             
         Returns:
-            Dictionary of settings in the section or empty dict if not found
+            Dictionary of settings in the section, or a read-only empty mapping if not found
         """
-        return self.settings.get(section, {})
+        return self.settings.get(section, _EMPTY)
         
     def set_section(self, section: str, values: Dict) -> None:
         """
@@ -192,11 +355,18 @@ class Settings:
             section: Section name
             values: Dictionary of settings to set
         """
-        self.settings[section] = values
-        
+        with self._save_lock:
+            self.settings[section] = values
+            self._rebuild_flat(section)
+            if section == "notes":
+                self._rebuild_note_index()
+            
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults"""
-        self.settings = DEFAULT_SETTINGS.copy()
+        with self._save_lock:
+            self.settings = copy.deepcopy(_FROZEN_DEFAULTS)
+            self._rebuild_note_index()
+            self._rebuild_flat()
         self.save()
         logger.info("Settings reset to defaults")
         
@@ -207,12 +377,287 @@ class Settings:
         Args:
             section: Section name to reset
         """
-        if section in DEFAULT_SETTINGS:
-            self.settings[section] = DEFAULT_SETTINGS[section].copy()
-            self.save()
+        if section in _FROZEN_DEFAULTS:
+            with self._save_lock:
+                self.settings[section] = copy.deepcopy(_FROZEN_DEFAULTS[section])
+                self._rebuild_flat(section)
+                if section == "notes":
+                    self._rebuild_note_index()
+            self.schedule_save()
             logger.info(f"Section {section} reset to defaults")
 
     # Notes management methods
+    def _rebuild_note_index(self) -> None:
+        """Rebuild the note id index from both note lists"""
+        self._note_index = {}
+        for container in ("items", "sticky_items"):
+            self._reindex_notes(container)
+            
+    def _reindex_notes(self, container: str, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Re-stamp index entries for a slice of a note list
+        
+        Args:
+            container: Name of the note list ("items" or "sticky_items")
+            start: First position to re-stamp
+            stop: Position to stop at, or None for the end of the list
+        """
+        notes = self.settings.get("notes", _EMPTY).get(container, [])
+        if stop is None:
+            stop = len(notes)
+        for i in range(start, stop):
+            self._note_index[notes[i].get("id")] = (container, i)
+            
+    def _find_note(self, note_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Locate a note by ID
+        
+        Args:
+            note_id: ID of the note
+            
+        Returns:
+            Tuple of (list name, position), or None if not found
+        """
+        location = self._note_index.get(note_id)
+        if location is not None:
+            container, index = location
+            notes = self.settings["notes"][container]
+            if index < len(notes) and notes[index].get("id") == note_id:
+                return location
+                
+        # The lists were changed behind our back, rebuild and retry once
+        self._rebuild_note_index()
+        return self._note_index.get(note_id)
+        
+    def _append_note_log(self, op: Dict) -> bool:
+        """
+        Append a note operation to the notes log
+        
+        Must be called with _save_lock held.
+        
+        Args:
+            op: The note operation
+            
+        Returns:
+            bool: True if written successfully, False otherwise
+        """
+        try:
+            if self._notes_log is None:
+                self._notes_log = open(self._notes_log_path, 'ab', buffering=0)
+            self._notes_log.write(_dumps_line(op))
+            self._notes_log_size = self._notes_log.tell()
+            
+            # Fold the log into the settings file at exit
+            self._dirty = True
+            return True
+        except Exception as e:
+            logger.error(f"Error writing notes log: {str(e)}")
+            return False
+            
+    def _truncate_notes_log(self) -> None:
+        """
+        Empty the notes log once the settings file includes its operations
+        
+        Must be called with _save_lock held.
+        """
+        if not self._notes_log_size:
+            return
+            
+        try:
+            if self._notes_log is not None:
+                self._notes_log.truncate(0)
+            else:
+                open(self._notes_log_path, 'wb').close()
+            self._notes_log_size = 0
+        except Exception as e:
+            logger.error(f"Error truncating notes log: {str(e)}")
+            
+    def _replay_notes_log(self) -> int:
+        """
+        Apply note operations logged since the last full save
+        
+        Operations are relative (toggle, move up, ...), so entries the
+        settings file already includes, e.g. after a crash between writing
+        it and truncating the log, are skipped by sequence number.
+        
+        Returns:
+            Number of log entries handled, replayed or skipped
+        """
+        try:
+            with open(self._notes_log_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.error(f"Error reading notes log: {str(e)}")
+            return 0
+            
+        self._notes_log_size = len(data)
+        notes = self.settings.setdefault("notes", {"items": [], "sticky_items": []})
+        saved_seq = notes.get("log_seq", 0)
+        replayed = skipped = 0
+        
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                op = _loads(line)
+                seq = op.get("seq")
+                if seq is not None and seq <= saved_seq:
+                    skipped += 1
+                    continue
+                    
+                self._apply_note_op(op)
+                if seq is not None:
+                    notes["log_seq"] = max(notes.get("log_seq", 0), seq)
+                replayed += 1
+            except Exception as e:
+                # Most likely a line cut short by a crash
+                logger.warning(f"Skipping unreadable notes log entry: {str(e)}")
+                
+        if replayed:
+            logger.info(f"Replayed {replayed} note operations from log")
+        if skipped:
+            logger.info(f"Skipped {skipped} logged note operations already in settings file")
+        return replayed + skipped
+        
+    def _commit_note_op(self, op: Dict) -> Optional[bool]:
+        """
+        Apply a note operation and record it in the notes log
+        
+        Args:
+            op: The note operation
+            
+        Returns:
+            Result of the operation, or None if it did not apply
+        """
+        with self._save_lock:
+            # The snapshot records the last sequence number it includes
+            seq = self._notes_seq + 1
+            op = dict(op, seq=seq)
+            result = self._apply_note_op(op)
+            if result is not None:
+                self._notes_seq = seq
+                self.settings["notes"]["log_seq"] = seq
+            logged = result is None or self._append_note_log(op)
+            
+        if not logged:
+            # Fall back to rewriting the whole settings file
+            self.schedule_save()
+        elif self._notes_log_size > NOTES_LOG_COMPACT_RATIO * self._snapshot_size:
+            self.schedule_save()
+            
+        return result
+        
+    def _apply_note_op(self, op: Dict) -> Optional[bool]:
+        """
+        Apply a note operation to the in-memory settings
+        
+        Args:
+            op: The note operation
+            
+        Returns:
+            Result of the operation, or None if it did not apply
+        """
+        kind = op.get("op")
+        if kind == "add":
+            return self._note_add(op["note"])
+        elif kind == "delete":
+            return self._note_delete(op["id"])
+        elif kind == "toggle":
+            return self._note_toggle(op["id"])
+        elif kind == "move":
+            return self._note_move(op["id"], op["direction"])
+        elif kind == "used":
+            return self._note_used(op["id"], op["last_used"])
+            
+        logger.warning(f"Unknown note operation: {kind}")
+        return None
+        
+    def _note_add(self, note_data: Dict) -> Optional[bool]:
+        """Append a note to the regular notes list"""
+        if "notes" not in self.settings:
+            self.settings["notes"] = {"items": [], "sticky_items": []}
+            
+        # A replayed add may already be part of the settings file
+        if self._find_note(note_data.get("id")) is not None:
+            return None
+            
+        items = self.settings["notes"]["items"]
+        items.append(note_data)
+        self._note_index[note_data.get("id")] = ("items", len(items) - 1)
+        return True
+        
+    def _note_delete(self, note_id: str) -> Optional[bool]:
+        """Remove a note from whichever list holds it"""
+        location = self._find_note(note_id)
+        if location is None:
+            return None
+            
+        container, index = location
+        del self.settings["notes"][container][index]
+        del self._note_index[note_id]
+        self._reindex_notes(container, index)
+        return True
+        
+    def _note_toggle(self, note_id: str) -> Optional[bool]:
+        """Move a note to the end of the other list, returning its new sticky state"""
+        location = self._find_note(note_id)
+        if location is None:
+            return None
+            
+        container, index = location
+        target = "items" if container == "sticky_items" else "sticky_items"
+        
+        note = self.settings["notes"][container].pop(index)
+        target_notes = self.settings["notes"][target]
+        target_notes.append(note)
+        
+        self._reindex_notes(container, index)
+        self._note_index[note_id] = (target, len(target_notes) - 1)
+        return target == "sticky_items"
+        
+    def _note_move(self, note_id: str, direction: str) -> Optional[bool]:
+        """Move a note within its list"""
+        location = self._find_note(note_id)
+        if location is None:
+            return None
+            
+        container, index = location
+        notes = self.settings["notes"][container]
+        
+        if direction == "up" and index > 0:
+            target = index - 1
+        elif direction == "down" and index < len(notes) - 1:
+            target = index + 1
+        elif direction == "top":
+            target = 0
+        elif direction == "bottom":
+            target = len(notes) - 1
+        else:
+            # Invalid direction or already at the edge
+            return None
+            
+        notes.insert(target, notes.pop(index))
+        self._reindex_notes(container, min(index, target), max(index, target) + 1)
+        return True
+        
+    def _note_used(self, note_id: str, last_used: Dict) -> Optional[bool]:
+        """Stamp a regular note as used and move it to the top"""
+        # Only move notes in the regular items list, not sticky
+        location = self._find_note(note_id)
+        if location is None or location[0] != "items":
+            return None
+            
+        index = location[1]
+        items = self.settings["notes"]["items"]
+        note_data = items.pop(index)
+        note_data["last_used"] = last_used
+        
+        items.insert(0, note_data)
+        self._reindex_notes("items", 0, index + 1)
+        return True
+        
     def add_note(self, note_data: Dict) -> bool:
         """
         Add a new note
@@ -223,11 +668,7 @@ class Settings:
         Returns:
             bool: True if added successfully
         """
-        if "notes" not in self.settings:
-            self.settings["notes"] = {"items": [], "sticky_items": []}
-            
-        self.settings["notes"]["items"].append(note_data)
-        return self.save()
+        return self._commit_note_op({"op": "add", "note": note_data}) is not None
         
     def get_notes(self) -> List[Dict]:
         """
@@ -236,7 +677,37 @@ class Settings:
         Returns:
             List of notes
         """
-        return self.settings.get("notes", {}).get("items", [])
+        return self.settings.get("notes", _EMPTY).get("items", [])
+        
+    def get_note(self, note_id: str) -> Optional[Dict]:
+        """
+        Get a note by ID from either list
+        
+        Args:
+            note_id: ID of the note
+            
+        Returns:
+            The note dictionary, or None if not found
+        """
+        location = self._find_note(note_id)
+        if location is None:
+            return None
+            
+        container, index = location
+        return self.settings["notes"][container][index]
+        
+    def is_note_sticky(self, note_id: str) -> bool:
+        """
+        Check whether a note is in the sticky list
+        
+        Args:
+            note_id: ID of the note
+            
+        Returns:
+            bool: True if the note exists and is sticky
+        """
+        location = self._find_note(note_id)
+        return location is not None and location[0] == "sticky_items"
         
     def get_sticky_notes(self) -> List[Dict]:
         """
@@ -245,7 +716,7 @@ class Settings:
         Returns:
             List of sticky notes
         """
-        return self.settings.get("notes", {}).get("sticky_items", [])
+        return self.settings.get("notes", _EMPTY).get("sticky_items", [])
         
     def delete_note(self, note_id: str) -> bool:
         """
@@ -257,30 +728,7 @@ class Settings:
         Returns:
             bool: True if deleted successfully
         """
-        deleted = False
-        
-        # Check in regular items
-        items = self.settings["notes"]["items"]
-        for i, note in enumerate(items):
-            if note.get("id") == note_id:
-                del items[i]
-                deleted = True
-                break
-                
-        # If not found, check in sticky items
-        if not deleted:
-            items = self.settings["notes"]["sticky_items"]
-            for i, note in enumerate(items):
-                if note.get("id") == note_id:
-                    del items[i]
-                    deleted = True
-                    break
-                    
-        if deleted:
-            self.save()
-            return True
-            
-        return False
+        return self._commit_note_op({"op": "delete", "id": note_id}) is not None
         
     def toggle_note_sticky(self, note_id: str) -> bool:
         """
@@ -292,33 +740,7 @@ class Settings:
         Returns:
             bool: New sticky state
         """
-        found = False
-        note_data = None
-        
-        # Look for note in regular items
-        for note in self.settings["notes"]["items"]:
-            if note.get("id") == note_id:
-                found = True
-                note_data = note
-                self.settings["notes"]["items"].remove(note)
-                self.settings["notes"]["sticky_items"].append(note)
-                break
-                
-        # If not found in regular items, check sticky items
-        if not found:
-            for note in self.settings["notes"]["sticky_items"]:
-                if note.get("id") == note_id:
-                    found = True
-                    note_data = note
-                    self.settings["notes"]["sticky_items"].remove(note)
-                    self.settings["notes"]["items"].append(note)
-                    break
-                    
-        if found and note_data:
-            self.save()
-            return note_id in [n.get("id") for n in self.settings["notes"]["sticky_items"]]
-            
-        return False
+        return bool(self._commit_note_op({"op": "toggle", "id": note_id}))
         
     def move_note(self, note_id: str, direction: str) -> bool:
         """
@@ -331,49 +753,29 @@ class Settings:
         Returns:
             bool: True if moved successfully
         """
-        # Determine which list contains the note
-        container = None
-        note_index = -1
-        note_data = None
-        
-        # Check regular items
-        for i, note in enumerate(self.settings["notes"]["items"]):
-            if note.get("id") == note_id:
-                container = self.settings["notes"]["items"]
-                note_index = i
-                note_data = note
-                break
-                
-        # Check sticky items if not found
-        if note_index == -1:
-            for i, note in enumerate(self.settings["notes"]["sticky_items"]):
-                if note.get("id") == note_id:
-                    container = self.settings["notes"]["sticky_items"]
-                    note_index = i
-                    note_data = note
-                    break
-                    
-        # If note was found, move it
-        if container and note_index >= 0 and note_data:
-            container.pop(note_index)
-            
-            if direction == "up" and note_index > 0:
-                container.insert(note_index - 1, note_data)
-            elif direction == "down" and note_index < len(container):
-                container.insert(note_index + 1, note_data)
-            elif direction == "top":
-                container.insert(0, note_data)
-            elif direction == "bottom":
-                container.append(note_data)
-            else:
-                # Invalid direction, put it back
-                container.insert(note_index, note_data)
+        op = {"op": "move", "id": note_id, "direction": direction}
+        return self._commit_note_op(op) is not None
+        
+    def set_note_content(self, note_id: str, content: str) -> bool:
+        """
+        Change the content of a note and schedule a save
+        
+        Args:
+            note_id: ID of the note
+            content: New content
+            
+        Returns:
+            bool: True if the note exists
+        """
+        with self._save_lock:
+            note = self.get_note(note_id)
+            if note is None:
                 return False
-                
-            self.save()
-            return True
+            note["content"] = content
             
-        return False
+        # Coalesce the writes of a burst of edits, exit flushes
+        self.schedule_save()
+        return True
         
     def update_note_used(self, note_id: str) -> bool:
         """
@@ -389,28 +791,11 @@ class Settings:
         if not self.get("general", "last_used_to_top", True):
             return False
             
-        # Only move notes in the regular items list, not sticky
-        note_index = -1
-        note_data = None
-        
-        for i, note in enumerate(self.settings["notes"]["items"]):
-            if note.get("id") == note_id:
-                note_index = i
-                note_data = note
-                break
-                
-        if note_index >= 0 and note_data:
-            # Update the last used timestamp
-            note_data["last_used"] = {
-                "timestamp": time.time(),
-                "date": time.strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Move to top
-            self.settings["notes"]["items"].pop(note_index)
-            self.settings["notes"]["items"].insert(0, note_data)
-            
-            self.save()
-            return True
-            
-        return False
+        # The timestamp is part of the operation so replaying it is deterministic
+        now = time.time()
+        last_used = {
+            "timestamp": now,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        }
+        op = {"op": "used", "id": note_id, "last_used": last_used}
+        return self._commit_note_op(op) is not None
@@ -5,19 +5,40 @@ Utilities for working with images in the clipboard manager.
 import logging
 import os
 import hashlib
+from collections import OrderedDict
 from io import BytesIO
-from typing import Optional, Tuple
-import tkinter as tk
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    logging.warning("PIL not available, image functionality will be limited")
+if TYPE_CHECKING:
+    from PIL import Image as PILImage, ImageTk
     
 logger = logging.getLogger(__name__)
 
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Number of thumbnails kept alive for reuse
+THUMB_CACHE_SIZE = 64
+
+# PIL (and its Tk bindings) are imported on first use, text-only sessions never pay for them
+_PIL_MODULES: Optional[Tuple[Any, Any, bool]] = None
+
+def _pil() -> Tuple[Any, Any, bool]:
+    """
+    Import PIL lazily
+    
+    Returns:
+        Tuple of (Image module, ImageTk module, available flag)
+    """
+    global _PIL_MODULES
+    if _PIL_MODULES is None:
+        try:
+            from PIL import Image, ImageTk
+            _PIL_MODULES = (Image, ImageTk, True)
+        except ImportError:
+            logger.warning("PIL not available, image functionality will be limited")
+            _PIL_MODULES = (None, None, False)
+    return _PIL_MODULES
+
 class ImageManager:
     """
     Manages image operations for the clipboard manager.
@@ -34,39 +55,64 @@ class ImageManager:
         """
         self.cache_dir = cache_dir
         self.max_cache_size = max_cache_size
-        self.cache = {}  # In-memory cache
+        self.cache: OrderedDict = OrderedDict()  # In-memory LRU cache
+        self._thumb_cache: OrderedDict = OrderedDict()  # (key, size) -> PhotoImage
         
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
         
+        # Keys of images stored on disk, scanned once so misses skip the filesystem
+        with os.scandir(cache_dir) as entries:
+            self._disk_keys = {e.name[:-4] for e in entries if e.name.endswith('.png')}
+            
         logger.debug("ImageManager initialized")
         
     def image_to_thumbnail(self, 
                           image_data: bytes, 
-                          size: Tuple[int, int] = (100, 100)) -> Optional[ImageTk.PhotoImage]:
+                          size: Tuple[int, int] = (100, 100),
+                          image: Optional["PILImage.Image"] = None,
+                          key: Optional[str] = None) -> Optional["ImageTk.PhotoImage"]:
         """
         Convert image data to a thumbnail
         
         Args:
             image_data: Raw image data bytes
             size: Thumbnail dimensions (width, height)
+            image: Already opened PIL image for image_data, resized in place
+            key: Cache key from cache_image, lets repeated calls reuse the thumbnail
             
         Returns:
             Tkinter-compatible thumbnail image, or None if failed
         """
-        if not PIL_AVAILABLE:
+        thumb_key = (key, size)
+        if key is not None and thumb_key in self._thumb_cache:
+            self._thumb_cache.move_to_end(thumb_key)
+            return self._thumb_cache[thumb_key]
+            
+        Image, ImageTk, pil_available = _pil()
+        if not pil_available:
             logger.error("Cannot create thumbnail: PIL not available")
             return None
             
         try:
-            # Create PIL image from data
-            img = Image.open(BytesIO(image_data))
+            # Create PIL image from data unless the caller already has one
+            img = image if image is not None else Image.open(BytesIO(image_data))
+            
+            # Let JPEG decode straight at a reduced scale before resampling
+            img.draft("RGB", size)
             
             # Create thumbnail
             img.thumbnail(size, Image.Resampling.LANCZOS)
             
             # Convert to Tkinter-compatible image
-            return ImageTk.PhotoImage(img)
+            photo = ImageTk.PhotoImage(img)
+            
+            if key is not None:
+                self._thumb_cache[thumb_key] = photo
+                if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
+                    
+            return photo
         except Exception as e:
             logger.error(f"Error creating thumbnail: {str(e)}")
             return None
@@ -85,25 +131,40 @@ class ImageManager:
         try:
             # Generate a key if not provided
             if key is None:
-                key = hashlib.md5(image_data).hexdigest()
+                key = hashlib.blake2b(image_data, digest_size=16).hexdigest()
                 
-            # Store in memory cache
+            # Store in memory cache as the most recently used entry
             self.cache[key] = image_data
+            self.cache.move_to_end(key)
             
+            # Already on disk (e.g. the same image copied again), skip the file work
+            if key in self._disk_keys:
+                self._manage_cache_size()
+                return key
+                
             # Optionally, also save to disk
             cache_path = os.path.join(self.cache_dir, f"{key}.png")
             if not os.path.exists(cache_path):
-                if PIL_AVAILABLE:
-                    try:
-                        img = Image.open(BytesIO(image_data))
-                        img.save(cache_path)
-                    except Exception as e:
-                        logger.error(f"Error saving image to cache: {str(e)}")
-                else:
-                    # Fallback: just write the raw bytes
+                if image_data[:8] == PNG_SIGNATURE:
+                    # Already a PNG, store it without decoding and re-encoding
                     with open(cache_path, 'wb') as f:
                         f.write(image_data)
-                        
+                    self._disk_keys.add(key)
+                else:
+                    Image, _, pil_available = _pil()
+                    if pil_available:
+                        try:
+                            img = Image.open(BytesIO(image_data))
+                            img.save(cache_path)
+                            self._disk_keys.add(key)
+                        except Exception as e:
+                            logger.error(f"Error saving image to cache: {str(e)}")
+                    else:
+                        # Fallback: just write the raw bytes
+                        with open(cache_path, 'wb') as f:
+                            f.write(image_data)
+                        self._disk_keys.add(key)
+                            
             # Manage cache size
             self._manage_cache_size()
             
@@ -124,9 +185,13 @@ class ImageManager:
         """
         # Check memory cache first
         if key in self.cache:
+            self.cache.move_to_end(key)
             return self.cache[key]
             
         # Try disk cache
+        if key not in self._disk_keys:
+            return None
+            
         cache_path = os.path.join(self.cache_dir, f"{key}.png")
         if os.path.exists(cache_path):
             try:
@@ -135,6 +200,7 @@ class ImageManager:
                     
                 # Update memory cache
                 self.cache[key] = data
+                self._manage_cache_size()
                 return data
             except Exception as e:
                 logger.error(f"Error reading image from cache: {str(e)}")
@@ -146,25 +212,29 @@ class ImageManager:
         if len(self.cache) <= self.max_cache_size:
             return
             
-        # Remove oldest items from memory cache
+        # Remove least recently used items from memory cache
         excess = len(self.cache) - self.max_cache_size
-        keys_to_remove = list(self.cache.keys())[:excess]
-        
-        for key in keys_to_remove:
-            del self.cache[key]
+        for _ in range(excess):
+            self.cache.popitem(last=False)
             
         logger.debug(f"Removed {excess} items from image cache")
         
     def clear_cache(self) -> None:
         """Clear all cached images"""
         self.cache.clear()
+        self._thumb_cache.clear()
         
-        # Clear disk cache
-        try:
-            for file in os.listdir(self.cache_dir):
-                if file.endswith('.png'):
-                    os.remove(os.path.join(self.cache_dir, file))
-                    
-            logger.info("Image cache cleared")
-        except Exception as e:
-            logger.error(f"Error clearing image cache: {str(e)}")
+        # Clear disk cache, removing only the files this cache wrote
+        failed = set()
+        for key in self._disk_keys:
+            try:
+                os.remove(os.path.join(self.cache_dir, f"{key}.png"))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Error removing cached image {key}: {str(e)}")
+                failed.add(key)
+                
+        # Keep track of files that are still on disk
+        self._disk_keys = failed
+        logger.info("Image cache cleared")
@@ -4,21 +4,34 @@
 ClipScribe Plus - Advanced Clipboard Manager
 Main entry point for the application
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import tkinter as tk
-from tkinter import messagebox
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("clipscribe.log"),
-        logging.StreamHandler()
-    ]
-)
+# Setup logging: callers only enqueue records, a listener thread does the I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler("clipscribe.log"),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+# Registered first so it runs last at exit, after other shutdown hooks have logged
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger("PIL").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Ensure all required directories exist
@@ -58,6 +71,7 @@ def main():
         
     except Exception as e:
         logger.exception("Fatal error in main program")
+        from tkinter import messagebox
         messagebox.showerror("Error", f"An error occurred: {str(e)}\n\nSee log file for details.")
         return 1
     
@@ -4,10 +4,30 @@ Example plugin for text formatting in ClipScribe Plus.
 """
 import logging
 import re
+from typing import Optional
+
 from core.plugin_manager import Plugin
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every clipboard change, compiled once. _CLEAN_RE matches
+# runs of 2+ spaces or 3+ newlines so both collapse in a single pass.
+_CLEAN_RE = re.compile(r'( {2,})|(\n{3,})')
+# Sentence starts: the beginning of the text, or whitespace after ., ? or !
+# Starts that are already a single space before a character upper() leaves
+# alone are skipped, so long, well-formed text runs few Python callbacks.
+_SENT_START_RE = re.compile(
+    r'(?:(?<=[.?!])(\s+)|^)(?!(?<=[.?!] )(?:[A-Z0-9.?!"\'(\[]|$))([^.?!]?)'
+)
+# URLs are length-capped (overlong ones are left whole, not cut) and stop at <, >
+# or " so already wrapped URLs are left alone
+_URL_RE = re.compile(r'(?<!<)https?://[^\s<>"]{1,2048}(?![^\s<>"])')
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    """Replacement for a _CLEAN_RE match"""
+    return ' ' if match.group(1) else '\n\n'
+
 class TextFormatterPlugin(Plugin):
     """
     Plugin for formatting text in clipboard.
@@ -22,9 +42,52 @@ class TextFormatterPlugin(Plugin):
     
     def __init__(self, app):
         super().__init__(app)
-        self.auto_capitalize = True
-        self.detect_urls = True
-        self.clean_whitespace = True
+        
+        # Last formatted input and its result (None when it was left as is)
+        self._last_input: Optional[str] = None
+        self._last_output: Optional[str] = None
+        
+        self._auto_capitalize_enabled = True
+        self._detect_urls_enabled = True
+        self._clean_whitespace_enabled = True
+        self._flags_changed()
+        
+    @property
+    def auto_capitalize(self) -> bool:
+        return self._auto_capitalize_enabled
+        
+    @auto_capitalize.setter
+    def auto_capitalize(self, value: bool) -> None:
+        self._auto_capitalize_enabled = value
+        self._flags_changed()
+        
+    @property
+    def detect_urls(self) -> bool:
+        return self._detect_urls_enabled
+        
+    @detect_urls.setter
+    def detect_urls(self, value: bool) -> None:
+        self._detect_urls_enabled = value
+        self._flags_changed()
+        
+    @property
+    def clean_whitespace(self) -> bool:
+        return self._clean_whitespace_enabled
+        
+    @clean_whitespace.setter
+    def clean_whitespace(self, value: bool) -> None:
+        self._clean_whitespace_enabled = value
+        self._flags_changed()
+        
+    def _flags_changed(self) -> None:
+        """Refresh derived state after a formatter toggle changes"""
+        # Keep a single flag so an idle formatter costs one check per change
+        self._any_enabled = (self._auto_capitalize_enabled or
+                             self._detect_urls_enabled or
+                             self._clean_whitespace_enabled)
+                             
+        # A cached result is stale once the formatters change
+        self._last_input = None
         
     def enable(self) -> bool:
         """Enable the plugin"""
@@ -43,7 +106,7 @@ class TextFormatterPlugin(Plugin):
         Args:
             item: The new clipboard item
         """
-        if not self.enabled:
+        if not self.enabled or not self._any_enabled:
             return
             
         if item.content_type != 'text':
@@ -51,6 +114,18 @@ class TextFormatterPlugin(Plugin):
             
         text = item.content
         
+        # Fast path: plain text with nothing any formatter would change
+        if ('  ' not in text and '\n\n\n' not in text and 'http' not in text
+                and '.' not in text and '?' not in text and '!' not in text
+                and text[:1] == text[:1].upper() and text == text.strip()):
+            return
+            
+        # Rapid-fire copies of the same text reuse the previous result
+        if text == self._last_input:
+            if self._last_output is not None:
+                item.content = self._last_output
+            return
+            
         # Apply formatting
         if self.clean_whitespace:
             text = self._clean_whitespace(text)
@@ -61,8 +136,12 @@ class TextFormatterPlugin(Plugin):
         if self.detect_urls:
             text = self._detect_urls(text)
             
-        # If text was modified, update the clipboard silently
-        if text != item.content:
+        self._last_input = item.content
+        self._last_output = text if text is not item.content else None
+        
+        # If text was modified, update the clipboard silently. Each formatter
+        # returns its input object when it has nothing to change.
+        if text is not item.content:
             logger.debug("Text formatter modified clipboard content")
             item.content = text
             
@@ -76,16 +155,9 @@ class TextFormatterPlugin(Plugin):
         Returns:
             Cleaned text
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
-        
-        # Trim whitespace from beginning/end
-        text = text.strip()
-        
-        # Remove extra newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text
+        # Replace multiple spaces with single space and extra newlines with
+        # a blank line, then trim whitespace from beginning/end
+        return _CLEAN_RE.sub(_collapse_whitespace, text).strip()
         
     def _auto_capitalize(self, text: str) -> str:
         """
@@ -97,24 +169,21 @@ class TextFormatterPlugin(Plugin):
         Returns:
             Text with capitalized sentences
         """
-        # Simple sentence detection and capitalization
-        sentences = re.split(r'(\.|\?|\!)\s+', text)
-        result = []
-        
-        for i in range(0, len(sentences), 2):
-            if i < len(sentences):
-                # Get the sentence and capitalize first letter
-                sentence = sentences[i]
-                if sentence and len(sentence) > 0:
-                    sentence = sentence[0].upper() + sentence[1:]
-                    
-                result.append(sentence)
-                
-                # Add punctuation and space if available
-                if i + 1 < len(sentences):
-                    result.append(sentences[i+1] + ' ')
-                    
-        return ''.join(result)
+        changed = False
+        
+        def capitalize(match: re.Match) -> str:
+            nonlocal changed
+            start = (' ' if match.group(1) else '') + match.group(2).upper()
+            if start != match.group(0):
+                changed = True
+            return start
+            
+        # Simple sentence detection and capitalization; the whitespace after
+        # sentence punctuation is normalized to a single space
+        result = _SENT_START_RE.sub(capitalize, text)
+        
+        # Hand back the input object itself when nothing changed
+        return result if changed else text
         
     def _detect_urls(self, text: str) -> str:
         """
@@ -126,10 +195,19 @@ class TextFormatterPlugin(Plugin):
         Returns:
             Text with formatted URLs
         """
-        # Simple URL detection - in a real plugin this would be more sophisticated
-        url_pattern = r'(https?://[^\s]+)'
-        return re.sub(url_pattern, r'<\1>', text)
+        # Cheap substring check skips the regex for the common no-URL case
+        if 'http' not in text:
+            return text
+            
+        # Simple URL detection - in a real plugin this would be more sophisticated.
+        # Keep the input object when nothing was wrapped, on_clipboard_change
+        # relies on that identity rather than on re internals.
+        wrapped, count = _URL_RE.subn(r'<\g<0>>', text)
+        return wrapped if count else text
         
     def on_shutdown(self) -> None:
         """Clean up when plugin is shut down"""
         logger.info("Text Formatter plugin shutting down")
+
+
+PLUGIN_CLASS = TextFormatterPlugin
@@ -4,11 +4,12 @@ Main application class for ClipScribe Plus.
 """
 import logging
 import os
-import threading
 import tkinter as tk
 from tkinter import messagebox
 import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from core.clipboard_manager import ClipboardManager
@@ -21,6 +22,75 @@ from ui.tray_icon import TrayIcon
 
 logger = logging.getLogger(__name__)
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    VK_CONTROL = 0x11
+    VK_V = 0x56
+    GWL_STYLE = -16
+    WS_MAXIMIZEBOX = 0x00010000
+    
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+        
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+        
+    class _INPUTUNION(ctypes.Union):
+        # MOUSEINPUT is the largest member and sets the size SendInput expects
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+        
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+        
+    # Resolve the user32 entry points once, with explicit signatures
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongW.restype = wintypes.LONG
+    
+    _SetWindowLongW = _user32.SetWindowLongW
+    _SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _SetWindowLongW.restype = wintypes.LONG
+    
+    _SendInput = _user32.SendInput
+    _SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _SendInput.restype = wintypes.UINT
+
+def _remove_maximize_box(hwnd: int) -> bool:
+    """
+    Clear the maximize box from a window's style
+    
+    Args:
+        hwnd: Native window handle
+        
+    Returns:
+        bool: True if the style was changed, False on other platforms
+    """
+    if sys.platform != "win32":
+        return False
+        
+    style = _GetWindowLongW(hwnd, GWL_STYLE)
+    _SetWindowLongW(hwnd, GWL_STYLE, style & ~WS_MAXIMIZEBOX)
+    return True
+
 class ClipScribeApp:
     """
     Main application class that coordinates all components.
@@ -46,6 +116,7 @@ class ClipScribeApp:
         
         # Initialize components
         self.settings = Settings()
+        self.refresh_cached_settings()
         self.theme_manager = ThemeManager()
         self.clipboard_manager = ClipboardManager(
             max_history=self.settings.get("general", "max_history_items", 100)
@@ -53,28 +124,37 @@ class ClipScribeApp:
         self.hotkey_manager = HotkeyManager()
         self.plugin_manager = PluginManager(self)
         
+        # Shared pool for background work that must not block the Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clipscribe")
+        
+        # Keyboard controller for simulated pastes, created on first use
+        self._kb = None
+        self._kb_keys = None
+        
+        # Prebuilt Ctrl+V key events for a single SendInput call on Windows
+        self._paste_inputs = self._build_paste_inputs()
+        
         # Register clipboard change listener for plugins
         self.clipboard_manager.add_clipboard_change_listener(
             self.plugin_manager.notify_clipboard_change
         )
         
-        # Initialize theme - always light
-        self.theme_manager.initialize_ttk_style(self.root)
-        
-        # Create main window
-        self.main_window = MainWindow(self)
+        # Main window and ttk styles are built once the mainloop is idle
+        self.main_window: Optional[MainWindow] = None
+        self._styles_ready = False
+        self._main_window_lock = threading.Lock()
         
         # Create system tray icon
         self.tray_icon = TrayIcon(self)
         
         # Windows list for multi-window support
-        self.windows = [self.main_window]
+        self.windows = []
         
         # Start services
         self._start_services()
         
         # Load plugins
-        threading.Thread(target=self._load_plugins, daemon=True).start()
+        self.executor.submit(self._load_plugins)
         
         # Set up global hotkeys
         self._setup_hotkeys()
@@ -83,27 +163,29 @@ class ClipScribeApp:
         self._disable_maximize()
         
         # Determine initial visibility
+        # Build the styles and main window on the Tk thread once the mainloop
+        # is idle, so the tray icon and services are up before the widget
+        # work; a minimized start builds it withdrawn, so hotkey and tray
+        # threads never have to construct it
         start_minimized = self.settings.get("general", "start_minimized", False)
         if not start_minimized:
-            self.show()
+            self.root.after_idle(self.show)
         else:
-            self.hide()
+            self.root.after_idle(self._ensure_main_window)
             
         logger.info("ClipScribe Plus initialization complete")
     
+    def refresh_cached_settings(self) -> None:
+        """Re-read settings that are checked on every paste or close"""
+        self._hide_after_paste = self.settings.get("general", "hide_after_paste", True)
+        self._min_to_tray = self.settings.get("general", "minimize_to_tray_on_close", True)
+        
     def _disable_maximize(self) -> None:
         """Disable maximize button on the window"""
         try:
             # This is Windows-specific
-            import ctypes
-            GWL_STYLE = -16
-            WS_MAXIMIZEBOX = 0x00010000
-            
-            hwnd = self.root.winfo_id()
-            style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_STYLE)
-            style = style & ~WS_MAXIMIZEBOX
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_STYLE, style)
-            logger.info("Maximize button disabled")
+            if _remove_maximize_box(self.root.winfo_id()):
+                logger.info("Maximize button disabled")
         except Exception as e:
             logger.error(f"Failed to disable maximize button: {str(e)}")
         
@@ -149,9 +231,11 @@ class ClipScribeApp:
             
             # Enable plugins that should be enabled
             enabled_plugins = self.settings.get("plugins", "enabled", [])
-            for plugin_name in enabled_plugins:
-                if plugin_name in plugins:
-                    self.plugin_manager.enable_plugin(plugin_name)
+            to_enable = [name for name in enabled_plugins if name in plugins]
+            if to_enable:
+                # Overlap the enable work of independent plugins
+                with ThreadPoolExecutor(max_workers=min(4, len(to_enable))) as executor:
+                    list(executor.map(self.plugin_manager.enable_plugin, to_enable))
                     
             logger.info(f"Loaded {len(plugins)} plugins, enabled {len(enabled_plugins)}")
         except Exception as e:
@@ -170,21 +254,21 @@ class ClipScribeApp:
         try:
             import time
             
-            note_id = str(uuid.uuid4())
-            timestamp = time.time()
-            date_str = time.strftime("%Y-%m-%d %H:%M:%S")
+            note_id = uuid.uuid4().hex
+            now = time.time()
+            
+            # A new note was created and last used at the same moment, the stamp
+            # is shared since last_used is only ever replaced, never edited
+            stamp = {
+                "timestamp": now,
+                "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            }
             
             note_data = {
                 "id": note_id,
                 "content": content,
-                "created": {
-                    "timestamp": timestamp,
-                    "date": date_str
-                },
-                "last_used": {
-                    "timestamp": timestamp,
-                    "date": date_str
-                }
+                "created": stamp,
+                "last_used": stamp
             }
             
             success = self.settings.add_note(note_data)
@@ -192,7 +276,8 @@ class ClipScribeApp:
             if success:
                 logger.info(f"Added new note: {note_id}")
                 # Refresh the main window to show the new note
-                self.main_window.refresh_notes()
+                if self.main_window:
+                    self.main_window.refresh_notes()
                 return True
             else:
                 logger.error("Failed to add note")
@@ -214,28 +299,12 @@ class ClipScribeApp:
             bool: True if updated successfully
         """
         try:
-            # Get all notes from settings
-            all_notes = self.settings.get_notes()
-            sticky_notes = self.settings.get_sticky_notes()
-            
-            # Look for the note in regular notes
-            for note in all_notes:
-                if note.get("id") == note_id:
-                    note["content"] = content
-                    self.settings.save()
-                    logger.info(f"Updated note: {note_id}")
-                    self.main_window.refresh_notes()
-                    return True
-                    
-            # Look for the note in sticky notes
-            for note in sticky_notes:
-                if note.get("id") == note_id:
-                    note["content"] = content
-                    self.settings.save()
-                    logger.info(f"Updated sticky note: {note_id}")
-                    self.main_window.refresh_notes()
-                    return True
-                    
+            if self.settings.set_note_content(note_id, content):
+                logger.info(f"Updated note: {note_id}")
+                if self.main_window:
+                    self.main_window.refresh_note(note_id)
+                return True
+                
             logger.warning(f"Note not found: {note_id}")
             return False
                 
@@ -243,44 +312,110 @@ class ClipScribeApp:
             logger.error(f"Error updating note: {str(e)}")
             return False
     
+    def _init_styles(self) -> None:
+        """Initialize ttk styles once, before the first window is built"""
+        if not self._styles_ready:
+            # Initialize theme - always light
+            self.theme_manager.initialize_ttk_style(self.root)
+            self._styles_ready = True
+            
+    def _ensure_main_window(self) -> MainWindow:
+        """
+        Create the main window on first use
+        
+        Returns:
+            The main window instance
+        """
+        # A hotkey or tray callback may race the idle build
+        with self._main_window_lock:
+            if self.main_window is None:
+                self._init_styles()
+                self.main_window = MainWindow(self)
+                self.windows.insert(0, self.main_window)
+        return self.main_window
+        
     def show(self) -> None:
         """Show the main application window"""
-        self.main_window.show()
+        self._ensure_main_window().show()
         
     def hide(self) -> None:
         """Hide the main application window"""
-        self.main_window.hide()
+        # Nothing to hide until the window has been built
+        if self.main_window:
+            self.main_window.hide()
         
     def toggle_visibility(self) -> None:
         """Toggle the visibility of the main window"""
-        self.main_window.toggle_visibility()
+        self._ensure_main_window().toggle_visibility()
         
     def paste_last_item(self) -> None:
         """Paste the most recent clipboard item"""
         if self.clipboard_manager.history:
-            self.clipboard_manager.copy_to_clipboard(self.clipboard_manager.history[-1])
-            # Simulate Ctrl+V
-            # This would require platform-specific code, example:
-            try:
-                from pynput.keyboard import Key, Controller
-                keyboard = Controller()
-                keyboard.press(Key.ctrl)
+            self.paste_item(self.clipboard_manager.history[-1])
+            
+    def paste_item(self, item) -> None:
+        """
+        Copy an item to the clipboard and paste it into the focused window
+        
+        Args:
+            item: The clipboard item to paste
+        """
+        self.clipboard_manager.copy_to_clipboard(item)
+        # Simulate Ctrl+V
+        # This would require platform-specific code, example:
+        try:
+            if self._paste_inputs is not None:
+                _SendInput(
+                    len(self._paste_inputs), self._paste_inputs, ctypes.sizeof(_INPUT)
+                )
+            else:
+                if self._kb is None:
+                    from pynput.keyboard import Key, Controller
+                    self._kb_keys = Key
+                    self._kb = Controller()
+                    
+                keyboard = self._kb
+                keyboard.press(self._kb_keys.ctrl)
                 keyboard.press('v')
                 keyboard.release('v')
-                keyboard.release(Key.ctrl)
+                keyboard.release(self._kb_keys.ctrl)
                 
-                # Hide window after paste if enabled
-                if self.settings.get("general", "hide_after_paste", True):
-                    self.hide()
-            except Exception as e:
-                logger.error(f"Error simulating paste: {str(e)}")
+            # Hide window after paste if enabled
+            if self._hide_after_paste:
+                self.hide()
+        except Exception as e:
+            logger.error(f"Error simulating paste: {str(e)}")
     
+    def _build_paste_inputs(self):
+        """
+        Build the Ctrl+V key event sequence for SendInput
+        
+        Returns:
+            ctypes INPUT array on Windows, None elsewhere
+        """
+        if sys.platform != "win32":
+            return None
+            
+        events = [
+            (VK_CONTROL, 0),
+            (VK_V, 0),
+            (VK_V, KEYEVENTF_KEYUP),
+            (VK_CONTROL, KEYEVENTF_KEYUP),
+        ]
+        inputs = (_INPUT * len(events))()
+        for event, (vk, flags) in zip(inputs, events):
+            event.type = INPUT_KEYBOARD
+            event.u.ki.wVk = vk
+            event.u.ki.dwFlags = flags
+        return inputs
+        
     def create_new_window(self) -> None:
         """Create a new ClipScribe window"""
         try:
             # Create new Toplevel window
             new_window = tk.Toplevel(self.root)
             new_window.withdraw()  # Hide until fully configured
+            self._init_styles()
             
             # Create new MainWindow instance
             window = MainWindow(self, new_window)
@@ -300,14 +435,7 @@ class ClipScribeApp:
         """Disable maximize button on a window"""
         try:
             # This is Windows-specific
-            import ctypes
-            GWL_STYLE = -16
-            WS_MAXIMIZEBOX = 0x00010000
-            
-            hwnd = window.winfo_id()
-            style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_STYLE)
-            style = style & ~WS_MAXIMIZEBOX
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_STYLE, style)
+            _remove_maximize_box(window.winfo_id())
         except Exception as e:
             logger.error(f"Failed to disable maximize button on child window: {str(e)}")
                 
@@ -315,7 +443,7 @@ class ClipScribeApp:
         """Handle application close event"""
         try:
             # Check if we should minimize to tray instead
-            if self.settings.get("general", "minimize_to_tray_on_close", True):
+            if self._min_to_tray:
                 self.hide()
                 return
                 
@@ -335,8 +463,8 @@ class ClipScribeApp:
             # Save settings
             self.settings.save()
             
-            # Stop clipboard monitoring
-            self.clipboard_manager.stop_monitoring()
+            # Stop clipboard monitoring and listener dispatch
+            self.clipboard_manager.shutdown()
             
             # Stop hotkey listener
             self.hotkey_manager.stop()
@@ -344,6 +472,9 @@ class ClipScribeApp:
             # Shut down plugins
             self.plugin_manager.shutdown()
             
+            # Drop queued background work
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            
             # Remove tray icon
             if hasattr(self, 'tray_icon') and self.tray_icon:
                 self.tray_icon.remove()
@@ -4,15 +4,44 @@ Context menu implementation for ClipScribe Plus.
 """
 import logging
 import tkinter as tk
+from contextlib import contextmanager
+from functools import partial, wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from core.plugin_manager import PluginAction
+
 logger = logging.getLogger(__name__)
 
+# How often the Tk thread checks for collected plugin actions
+PLUGIN_ACTIONS_POLL_MS = 25
+
+def _log_errors(message: str) -> Callable:
+    """
+    Decorate a menu action so exceptions are logged instead of raised
+    
+    Args:
+        message: Log message prefix, e.g. "Error copying item"
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", message, e)
+        return wrapper
+    return decorator
+
 class ContextMenu:
     """
     Right-click context menu implementation.
     """
     
+    __slots__ = (
+        "parent", "theme_manager", "menu", "_applied_theme_key",
+        "_submenus", "_built", "_pending",
+    )
+    
     def __init__(self, parent: tk.Widget, theme_manager=None):
         """
         Initialize context menu
@@ -24,8 +53,18 @@ class ContextMenu:
         self.parent = parent
         self.theme_manager = theme_manager
         self.menu = tk.Menu(parent, tearoff=0)
+        self._applied_theme_key: Optional[Tuple[str, int]] = None
+        self._submenus: List['ContextMenu'] = []
+        self._built = False
+        
+        # Queued (method, kwargs) calls while inside batch(), None otherwise
+        self._pending: Optional[List[Tuple[Callable, Dict[str, Any]]]] = None
         self._apply_theme()
         
+        # Restyle when the theme changes rather than on every popup
+        if self.theme_manager:
+            self.theme_manager.add_theme_change_listener(self._apply_theme)
+            
     def _apply_theme(self) -> None:
         """Apply current theme to menu"""
         if not self.theme_manager:
@@ -33,6 +72,12 @@ class ContextMenu:
             
         try:
             theme_id = self.theme_manager.current_theme
+            
+            # Skip the Tk round-trip when the menu already has this theme
+            key = (theme_id, self.theme_manager.version)
+            if key == self._applied_theme_key:
+                return
+                
             if theme_id in self.theme_manager.themes:
                 theme = self.theme_manager.themes[theme_id]
                 colors = theme.get("colors", {})
@@ -46,8 +91,53 @@ class ContextMenu:
                     borderwidth=1,
                     relief="solid"
                 )
+                self._applied_theme_key = key
         except Exception as e:
-            logger.error(f"Error applying theme to context menu: {str(e)}")
+            logger.error("Error applying theme to context menu: %s", e)
+            
+    def _build_menu(self) -> None:
+        """Add the menu items, called on the first popup"""
+        pass
+        
+    def _add_static_items(self, items: Tuple[Tuple[str, Optional[str], Optional[str]], ...]) -> None:
+        """
+        Add fixed entries described by (kind, label, method name) tuples
+        
+        Args:
+            items: Entries where kind is "command" or "separator"
+        """
+        for kind, label, attr in items:
+            if kind == "separator":
+                self.add_separator()
+            else:
+                self.add_command(label, getattr(self, attr))
+                
+    @contextmanager
+    def batch(self):
+        """
+        Queue menu additions and issue them to Tk together on exit
+        
+        Yields:
+            ContextMenu: This menu
+        """
+        self._pending = []
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+            
+        pending, self._pending = self._pending, None
+        for method, kwargs in pending:
+            method(**kwargs)
+        self._apply_theme()
+        
+    def _add(self, method: Callable, **kwargs) -> None:
+        """Call a Tk menu method now, or queue it while batching"""
+        if self._pending is not None:
+            self._pending.append((method, kwargs))
+        else:
+            method(**kwargs)
             
     def add_command(self, label: str, command: Callable[[], None], **kwargs) -> None:
         """
@@ -58,11 +148,11 @@ class ContextMenu:
             command: Function to call when clicked
             **kwargs: Additional arguments for menu.add_command
         """
-        self.menu.add_command(label=label, command=command, **kwargs)
+        self._add(self.menu.add_command, label=label, command=command, **kwargs)
         
     def add_separator(self) -> None:
         """Add a separator to the context menu"""
-        self.menu.add_separator()
+        self._add(self.menu.add_separator)
         
     def add_submenu(self, label: str) -> 'ContextMenu':
         """
@@ -75,7 +165,8 @@ class ContextMenu:
             ContextMenu: New submenu instance
         """
         submenu = ContextMenu(self.parent, self.theme_manager)
-        self.menu.add_cascade(label=label, menu=submenu.menu)
+        self._add(self.menu.add_cascade, label=label, menu=submenu.menu)
+        self._submenus.append(submenu)
         return submenu
         
     def add_checkbutton(self, label: str, variable: tk.BooleanVar, **kwargs) -> None:
@@ -87,7 +178,7 @@ class ContextMenu:
             variable: BooleanVar to store state
             **kwargs: Additional arguments for menu.add_checkbutton
         """
-        self.menu.add_checkbutton(label=label, variable=variable, **kwargs)
+        self._add(self.menu.add_checkbutton, label=label, variable=variable, **kwargs)
         
     def add_radiobutton(self, label: str, variable: tk.StringVar, value: str, **kwargs) -> None:
         """
@@ -99,7 +190,7 @@ class ContextMenu:
             value: Value for this option
             **kwargs: Additional arguments for menu.add_radiobutton
         """
-        self.menu.add_radiobutton(label=label, variable=variable, value=value, **kwargs)
+        self._add(self.menu.add_radiobutton, label=label, variable=variable, value=value, **kwargs)
         
     def popup(self, event) -> None:
         """
@@ -109,18 +200,45 @@ class ContextMenu:
             event: Event with x_root and y_root coordinates
         """
         try:
-            # Apply theme before showing (in case theme changed)
-            self._apply_theme()
-            
+            # Items are built on first use, most rows are never right-clicked
+            if not self._built:
+                self._build_menu()
+                self._built = True
+                
             # Show menu at click position
             self.menu.tk_popup(event.x_root, event.y_root)
         finally:
-            # Make sure to release the grab
-            self.menu.grab_release()
+            # Make sure to release the grab, once the menu has been drawn
+            self.menu.after_idle(self.menu.grab_release)
+            
+    def warm_up(self) -> None:
+        """Realize the menu ahead of time so the first popup is not a cold start"""
+        try:
+            self.menu.update_idletasks()
+            
+            # Posting is modal on Windows and macOS, only pre-post off-screen on X11
+            if self.menu.tk.call('tk', 'windowingsystem') == 'x11':
+                self.menu.post(-10000, -10000)
+                self.menu.unpost()
+        except tk.TclError as e:
+            logger.debug("Could not warm up context menu: %s", e)
             
     def clear(self) -> None:
         """Remove all items from the context menu"""
         self.menu.delete(0, 'end')
+        for submenu in self._submenus:
+            submenu.destroy()
+        self._submenus.clear()
+        
+    def destroy(self) -> None:
+        """Stop listening for theme changes and destroy the menu"""
+        for submenu in self._submenus:
+            submenu.destroy()
+        self._submenus.clear()
+        
+        if self.theme_manager:
+            self.theme_manager.remove_theme_change_listener(self._apply_theme)
+        self.menu.destroy()
 
 
 class ClipboardItemContextMenu(ContextMenu):
@@ -128,7 +246,21 @@ class ClipboardItemContextMenu(ContextMenu):
     Context menu specialized for clipboard items.
     """
     
-    def __init__(self, parent: tk.Widget, app, item_id: str, theme_manager=None):
+    __slots__ = ("app", "item_id", "_window", "_edit_fn", "_refresh_fn", "_plugins_submenu")
+    
+    # One menu serves every row, see get_shared()
+    _shared: Optional['ClipboardItemContextMenu'] = None
+    
+    # Entries that do not depend on the item or installed plugins
+    _STATIC_ITEMS = (
+        ("command", "Copy", "_copy_item"),
+        ("command", "Paste", "_paste_item"),
+        ("separator", None, None),
+        ("command", "Edit", "_edit_item"),
+        ("command", "Delete", "_delete_item"),
+    )
+    
+    def __init__(self, parent: tk.Widget, app, item_id: Optional[str], theme_manager=None):
         """
         Initialize clipboard item context menu
         
@@ -141,79 +273,158 @@ class ClipboardItemContextMenu(ContextMenu):
         super().__init__(parent, theme_manager)
         self.app = app
         self.item_id = item_id
-        self._build_menu()
+        
+        # Main window callbacks, resolved on popup once the window exists
+        self._window = None
+        self._edit_fn: Optional[Callable[[str], None]] = None
+        self._refresh_fn: Optional[Callable[[], None]] = None
+        self._plugins_submenu: Optional[ContextMenu] = None
+        
+    @classmethod
+    def get_shared(cls, parent: tk.Widget, app, theme_manager=None) -> 'ClipboardItemContextMenu':
+        """
+        Get the menu shared by all clipboard item rows
+        
+        Args:
+            parent: Parent widget
+            app: ClipScribeApp instance
+            theme_manager: ThemeManager instance
+            
+        Returns:
+            ClipboardItemContextMenu: The shared menu, pass the row's item_id to popup()
+        """
+        if cls._shared is None or not cls._shared.menu.winfo_exists():
+            cls._shared = cls(parent, app, None, theme_manager)
+            # Get the menu realized before the first right-click
+            cls._shared.menu.after_idle(cls._shared.warm_up)
+        return cls._shared
+        
+    def popup(self, event, item_id: Optional[str] = None) -> None:
+        """
+        Show the context menu for an item
+        
+        Args:
+            event: Event with x_root and y_root coordinates
+            item_id: Clipboard item to act on, or None to keep the current one
+        """
+        window = self.app.main_window
+        if window is not self._window:
+            self._window = window
+            self._edit_fn = getattr(window, 'edit_clipboard_item', None)
+            self._refresh_fn = getattr(window, 'refresh_history', None)
+            
+        if item_id is not None and item_id != self.item_id:
+            # Plugin actions depend on the item, rebuild on the way up
+            self.item_id = item_id
+            self.clear()
+            self._plugins_submenu = None
+            self._built = False
+        super().popup(event)
         
     def _build_menu(self) -> None:
         """Build the context menu items"""
-        self.add_command("Copy", self._copy_item)
-        self.add_command("Paste", self._paste_item)
-        self.add_separator()
-        self.add_command("Edit", self._edit_item)
-        self.add_command("Delete", self._delete_item)
-        self.add_separator()
-        
-        # Add plugin actions submenu if plugins are available
-        if hasattr(self.app, 'plugin_manager'):
-            plugins_submenu = self.add_submenu("Plugin Actions")
-            plugin_actions = self.app.plugin_manager.get_item_actions(self.item_id)
+        with self.batch():
+            self._add_static_items(self._STATIC_ITEMS)
             
-            if plugin_actions:
-                for action in plugin_actions:
-                    plugins_submenu.add_command(
-                        action.get("label", "Action"),
-                        lambda a=action: self._execute_plugin_action(a)
-                    )
-            else:
-                plugins_submenu.add_command("No actions available", lambda: None, state="disabled")
+            # Add plugin actions submenu only if a plugin offers item actions
+            plugin_manager = getattr(self.app, 'plugin_manager', None)
+            if plugin_manager and plugin_manager.has_item_action_providers():
+                self.add_separator()
+                plugins_submenu = self.add_submenu("Plugin Actions")
+                plugins_submenu.add_command("Loading...", lambda: None, state="disabled")
+                self._plugins_submenu = plugins_submenu
                 
-    def _copy_item(self) -> None:
-        """Copy the clipboard item to the clipboard"""
+                # Plugin code may be slow, collect the actions off the Tk thread;
+                # the result is picked up by polling, as Tk may only be called
+                # from its own thread
+                item_id = self.item_id
+                future = self.app.executor.submit(plugin_manager.get_item_actions, item_id)
+                self._poll_plugins(plugins_submenu, item_id, future)
+                
+    def _poll_plugins(self, submenu: ContextMenu, item_id: Optional[str], future) -> None:
+        """
+        Wait on the Tk thread for the plugin actions, then fill the submenu
+        
+        Args:
+            submenu: The submenu the request was made for
+            item_id: Item the actions are collected for
+            future: Future holding the tuple of actions
+        """
+        # The menu was rebuilt for another item in the meantime
+        if submenu is not self._plugins_submenu or item_id != self.item_id:
+            return
+            
+        if future.done():
+            self._populate_plugins(submenu, item_id, future)
+        else:
+            self.menu.after(PLUGIN_ACTIONS_POLL_MS, self._poll_plugins, submenu, item_id, future)
+            
+    def _populate_plugins(self, submenu: ContextMenu, item_id: Optional[str], future) -> None:
+        """
+        Fill the Plugin Actions submenu once the actions have been collected
+        
+        Args:
+            submenu: The submenu the request was made for
+            item_id: Item the actions were collected for
+            future: Future holding the tuple of action dictionaries
+        """
+        # The menu was rebuilt for another item in the meantime
+        if submenu is not self._plugins_submenu or item_id != self.item_id:
+            return
+            
         try:
-            item = self.app.clipboard_manager.get_item_by_id(self.item_id)
-            if item:
-                self.app.clipboard_manager.copy_to_clipboard(item)
+            plugin_actions = future.result()
         except Exception as e:
-            logger.error(f"Error copying item: {str(e)}")
+            logger.error("Error collecting plugin actions: %s", e)
+            plugin_actions = ()
+            
+        submenu.clear()
+        with submenu.batch():
+            for action in plugin_actions:
+                submenu.add_command(action.label, partial(self._execute_plugin_action, action))
+            if not plugin_actions:
+                submenu.add_command("No actions available", lambda: None, state="disabled")
+                
+    @_log_errors("Error copying item")
+    def _copy_item(self) -> None:
+        """Copy the clipboard item to the clipboard"""
+        item = self.app.clipboard_manager.get_item_by_id(self.item_id)
+        if item:
+            self.app.clipboard_manager.copy_to_clipboard(item)
             
+    @_log_errors("Error pasting item")
     def _paste_item(self) -> None:
         """Copy item to clipboard and simulate paste"""
-        self._copy_item()
-        self.app.paste_last_item()
+        item = self.app.clipboard_manager.get_item_by_id(self.item_id)
+        if item:
+            self.app.paste_item(item)
         
+    @_log_errors("Error editing item")
     def _edit_item(self) -> None:
         """Open editor for the clipboard item"""
-        try:
-            # This would call the edit dialog implementation
-            if hasattr(self.app.main_window, 'edit_clipboard_item'):
-                self.app.main_window.edit_clipboard_item(self.item_id)
-        except Exception as e:
-            logger.error(f"Error editing item: {str(e)}")
+        # This would call the edit dialog implementation
+        if self._edit_fn:
+            self._edit_fn(self.item_id)
             
+    @_log_errors("Error deleting item")
     def _delete_item(self) -> None:
         """Delete the clipboard item"""
-        try:
-            self.app.clipboard_manager.delete_item(self.item_id)
-            # Refresh the UI if needed
-            if hasattr(self.app.main_window, 'refresh_history'):
-                self.app.main_window.refresh_history()
-        except Exception as e:
-            logger.error(f"Error deleting item: {str(e)}")
+        self.app.clipboard_manager.delete_item(self.item_id)
+        # Refresh the UI if needed
+        if self._refresh_fn:
+            self._refresh_fn()
             
-    def _execute_plugin_action(self, action: Dict) -> None:
+    @_log_errors("Error executing plugin action")
+    def _execute_plugin_action(self, action: PluginAction) -> None:
         """
         Execute a plugin action on the clipboard item
         
         Args:
-            action: Plugin action dictionary
+            action: Plugin action, validated by the plugin manager
         """
-        try:
-            callback = action.get("callback")
-            if callable(callback):
-                item = self.app.clipboard_manager.get_item_by_id(self.item_id)
-                if item:
-                    callback(item)
-        except Exception as e:
-            logger.error(f"Error executing plugin action: {str(e)}")
+        item = self.app.clipboard_manager.get_item_by_id(self.item_id)
+        if item:
+            action.callback(item)
 
 
 class NoteContextMenu(ContextMenu):
@@ -221,7 +432,31 @@ class NoteContextMenu(ContextMenu):
     Context menu specialized for notes.
     """
     
-    def __init__(self, parent: tk.Widget, app, note_id: str, theme_manager=None):
+    __slots__ = (
+        "app", "note_id", "_pin_index",
+        "_window", "_edit_fn", "_delete_fn", "_refresh_fn",
+    )
+    
+    # One menu serves every note row, see get_shared()
+    _shared: Optional['NoteContextMenu'] = None
+    
+    _STATIC_ITEMS = (
+        ("command", "Copy to Clipboard", "_copy_note"),
+        ("separator", None, None),
+        ("command", "Edit", "_edit_note"),
+        ("command", "Delete", "_delete_note"),
+        ("separator", None, None),
+    )
+    
+    # (label, direction) pairs for the Position submenu
+    _POSITION_ITEMS = (
+        ("Move Up", "up"),
+        ("Move Down", "down"),
+        ("Move to Top", "top"),
+        ("Move to Bottom", "bottom"),
+    )
+    
+    def __init__(self, parent: tk.Widget, app, note_id: Optional[str], theme_manager=None):
         """
         Initialize note context menu
         
@@ -234,58 +469,99 @@ class NoteContextMenu(ContextMenu):
         super().__init__(parent, theme_manager)
         self.app = app
         self.note_id = note_id
-        self._build_menu()
+        self._pin_index: Optional[int] = None
+        
+        # Main window callbacks, resolved on popup once the window exists
+        self._window = None
+        self._edit_fn: Optional[Callable[[str], None]] = None
+        self._delete_fn: Optional[Callable[[str], None]] = None
+        self._refresh_fn: Optional[Callable[[], None]] = None
+        
+    @classmethod
+    def get_shared(cls, parent: tk.Widget, app, theme_manager=None) -> 'NoteContextMenu':
+        """
+        Get the menu shared by all note rows
+        
+        Args:
+            parent: Parent widget
+            app: ClipScribeApp instance
+            theme_manager: ThemeManager instance
+            
+        Returns:
+            NoteContextMenu: The shared menu, pass the row's note_id to popup()
+        """
+        if cls._shared is None or not cls._shared.menu.winfo_exists():
+            cls._shared = cls(parent, app, None, theme_manager)
+            # Get the menu realized before the first right-click
+            cls._shared.menu.after_idle(cls._shared.warm_up)
+        return cls._shared
         
     def _build_menu(self) -> None:
         """Build the context menu items"""
-        self.add_command("Copy to Clipboard", self._copy_note)
-        self.add_separator()
-        self.add_command("Edit", self._edit_note)
-        self.add_command("Delete", self._delete_note)
-        self.add_separator()
-        
-        # Note position submenu
-        position_submenu = self.add_submenu("Position")
-        position_submenu.add_command("Move Up", lambda: self._move_note("up"))
-        position_submenu.add_command("Move Down", lambda: self._move_note("down"))
-        position_submenu.add_command("Move to Top", lambda: self._move_note("top"))
-        position_submenu.add_command("Move to Bottom", lambda: self._move_note("bottom"))
-        
-        # Pin/Unpin toggle
-        is_sticky = self._is_note_sticky()
-        pin_label = "Unpin Note" if is_sticky else "Pin to Top"
-        self.add_command(pin_label, self._toggle_sticky)
+        with self.batch():
+            self._add_static_items(self._STATIC_ITEMS)
+            
+            # Note position submenu
+            position_submenu = self.add_submenu("Position")
+            for label, direction in self._POSITION_ITEMS:
+                position_submenu.add_command(label, partial(self._move_note, direction))
+            
+            # Pin/Unpin toggle
+            self.add_command(self._pin_label(), self._toggle_sticky)
+            
+        # The pin entry index is only known once the batch is flushed
+        self._pin_index = self.menu.index('end')
         
+    def _pin_label(self) -> str:
+        """Label for the pin toggle matching the note's current state"""
+        return "Unpin Note" if self._is_note_sticky() else "Pin to Top"
+        
+    def popup(self, event, note_id: Optional[str] = None) -> None:
+        """
+        Show the context menu, refreshing the pin label if already built
+        
+        Args:
+            event: Event with x_root and y_root coordinates
+            note_id: Note to act on, or None to keep the current one
+        """
+        window = self.app.main_window
+        if window is not self._window:
+            self._window = window
+            self._edit_fn = getattr(window, 'edit_note', None)
+            self._delete_fn = getattr(window, 'delete_note', None)
+            self._refresh_fn = getattr(window, 'refresh_notes', None)
+            
+        # Every entry reads note_id when clicked, only the pin label depends on it
+        if note_id is not None:
+            self.note_id = note_id
+            
+        if self._pin_index is not None:
+            self.menu.entryconfigure(self._pin_index, label=self._pin_label())
+        super().popup(event)
+        
+    @_log_errors("Error copying note")
     def _copy_note(self) -> None:
         """Copy the note content to clipboard"""
-        try:
-            notes = self.app.settings.get_notes() + self.app.settings.get_sticky_notes()
-            for note in notes:
-                if note.get("id") == self.note_id:
-                    content = note.get("content", "")
-                    self.app.clipboard_manager.set_clipboard_text(content)
-                    break
-        except Exception as e:
-            logger.error(f"Error copying note: {str(e)}")
+        note = self.app.settings.get_note(self.note_id)
+        if note is not None:
+            content = note.get("content", "")
+            self.app.clipboard_manager.set_clipboard_text(content)
             
+    @_log_errors("Error editing note")
     def _edit_note(self) -> None:
         """Open editor for the note"""
-        try:
-            # This would call the note editor implementation
-            if hasattr(self.app.main_window, 'edit_note'):
-                self.app.main_window.edit_note(self.note_id)
-        except Exception as e:
-            logger.error(f"Error editing note: {str(e)}")
+        # This would call the note editor implementation
+        if self._edit_fn:
+            self._edit_fn(self.note_id)
             
+    @_log_errors("Error deleting note")
     def _delete_note(self) -> None:
         """Delete the note"""
-        try:
-            # This would call the note deletion implementation
-            if hasattr(self.app.main_window, 'delete_note'):
-                self.app.main_window.delete_note(self.note_id)
-        except Exception as e:
-            logger.error(f"Error deleting note: {str(e)}")
+        # This would call the note deletion implementation
+        if self._delete_fn:
+            self._delete_fn(self.note_id)
             
+    @_log_errors("Error moving note")
     def _move_note(self, direction: str) -> None:
         """
         Move the note in the specified direction
@@ -293,25 +569,19 @@ class NoteContextMenu(ContextMenu):
         Args:
             direction: Direction to move (up, down, top, bottom)
         """
-        try:
-            self.app.settings.move_note(self.note_id, direction)
-            # Refresh notes display
-            if hasattr(self.app.main_window, 'refresh_notes'):
-                self.app.main_window.refresh_notes()
-        except Exception as e:
-            logger.error(f"Error moving note: {str(e)}")
+        self.app.settings.move_note(self.note_id, direction)
+        # Refresh notes display
+        if self._refresh_fn:
+            self._refresh_fn()
             
+    @_log_errors("Error toggling note sticky state")
     def _toggle_sticky(self) -> None:
         """Toggle the note's sticky status"""
-        try:
-            self.app.settings.toggle_note_sticky(self.note_id)
-            # Refresh notes display
-            if hasattr(self.app.main_window, 'refresh_notes'):
-                self.app.main_window.refresh_notes()
-        except Exception as e:
-            logger.error(f"Error toggling note sticky state: {str(e)}")
+        self.app.settings.toggle_note_sticky(self.note_id)
+        # Refresh notes display
+        if self._refresh_fn:
+            self._refresh_fn()
             
     def _is_note_sticky(self) -> bool:
         """Check if the note is sticky"""
-        sticky_notes = self.app.settings.get_sticky_notes()
-        return any(note.get("id") == self.note_id for note in sticky_notes)
+        return self.app.settings.is_note_sticky(self.note_id)
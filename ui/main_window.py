@@ -4,18 +4,44 @@ Main application window for ClipScribe Plus.
 """
 import logging
 import os
+import re
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, messagebox, simpledialog
 import uuid
 from typing import Callable, Dict, List, Optional, Any, Union
 
 logger = logging.getLogger(__name__)
 
+# Note row layout: wraplength before the canvas is first sized, and the
+# room taken by the row borders and padding once it is
+NOTE_WRAPLENGTH = 350
+NOTE_WRAP_MARGIN = 30
+NOTE_DATE_FONT = ("Segoe UI", 8)
+
+# Bind tag carrying the notes mouse wheel bindings
+NOTES_SCROLL_TAG = "NotesScroll"
+
+# Bind tag carrying the click bindings of the note content labels
+NOTE_CONTENT_TAG = "NoteContent"
+
+# Tk window geometry string: WxH+X+Y
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
 class MainWindow:
     """
     Main application window that shows clipboard history and manages user interactions.
     """
     
+    # Toolbar buttons: (attribute, tooltip, text, handler method, side)
+    _TOOLBAR_BUTTONS = (
+        ("btn_new", "New Note", "➕", "on_new_note", tk.LEFT),
+        ("btn_settings", "Settings", "⚙", "on_settings", tk.LEFT),
+        ("btn_plugins", "Plugins", "🔌", "on_plugins", tk.LEFT),
+        ("btn_minimize", "Minimize", "—", "hide", tk.RIGHT),
+        ("btn_close", "Close", "✕", "on_window_close", tk.RIGHT)
+    )
+    
     def __init__(self, app, parent=None):
         """
         Initialize the main window.
@@ -31,10 +57,34 @@ class MainWindow:
         self.collapsed = False
         self.collapse_timer = None
         
-        # Auto-collapse settings
-        self.auto_collapse_enabled = app.settings.get("ui", "enable_auto_collapse", True)
-        self.auto_collapse_position = app.settings.get("general", "auto_collapse", {}).get("position", "right")
-        self.auto_collapse_delay = app.settings.get("general", "auto_collapse", {}).get("delay_seconds", 1.5) * 1000
+        # Note id -> row widgets and the values they currently show
+        self._note_widgets: Dict[str, Dict[str, Any]] = {}
+        self._pinned_section: Optional[ttk.Label] = None
+        self._notes_section: Optional[ttk.Label] = None
+        self._note_by_label: Dict[str, Dict[str, Any]] = {}
+        self._note_wraplength = NOTE_WRAPLENGTH
+        
+        # Refreshes requested in the same idle cycle run once
+        self._refresh_notes_pending = False
+        self._refresh_history_pending = False
+        
+        # Settings and plugins dialogs, built on first open and then reused
+        self._settings_window: Optional[tk.Toplevel] = None
+        self._reload_settings_dialog: Optional[Callable[[], None]] = None
+        self._plugins_window: Optional[tk.Toplevel] = None
+        self._reload_plugins_dialog: Optional[Callable[[], None]] = None
+        
+        # Shared tooltip window, created on first hover
+        self._tooltip: Optional[tk.Toplevel] = None
+        self._tooltip_label: Optional[ttk.Label] = None
+        
+        # Theme values used when building widgets, refreshed on theme change
+        self._theme_cache: Dict[str, Any] = {}
+        self._cache_theme()
+        app.theme_manager.add_theme_change_listener(self._cache_theme)
+        
+        # Settings checked from event handlers
+        self.refresh_cached_settings()
         
         # Create window if not already provided
         if isinstance(parent, tk.Tk) or isinstance(parent, tk.Toplevel):
@@ -54,6 +104,31 @@ class MainWindow:
         
         logger.info("Main window initialized")
         
+    def refresh_cached_settings(self) -> None:
+        """Re-read settings that are checked from event handlers"""
+        settings = self.app.settings
+        
+        # Auto-collapse settings
+        auto_collapse = settings.get("general", "auto_collapse", {})
+        self.auto_collapse_enabled = settings.get("ui", "enable_auto_collapse", True)
+        self.auto_collapse_position = auto_collapse.get("position", "right")
+        self.auto_collapse_delay = auto_collapse.get("delay_seconds", 1.5) * 1000
+        
+        self._confirm_delete = settings.get("general", "confirm_delete", True)
+        self._hide_after_paste = settings.get("general", "hide_after_paste", True)
+        self._always_on_top = settings.get("ui", "always_on_top", False)
+        
+    def _cache_theme(self) -> None:
+        """Cache the theme colours and font the widgets are built with"""
+        theme = self.app.theme_manager.themes["light"]
+        colors = theme["colors"]
+        self._theme_cache = {
+            "bg": colors["background"],
+            "fg": colors["foreground"],
+            "accent": colors["accent"],
+            "font": theme["fonts"]["main"]
+        }
+        
     def _configure_window(self) -> None:
         """Configure window properties"""
         # Set window title
@@ -65,6 +140,9 @@ class MainWindow:
         # Set initial size and position
         self.window.geometry("400x500+100+100")
         
+        # Screen size used by auto-collapse, re-read whenever the window is shown
+        self._screen_size = (self.window.winfo_screenwidth(), self.window.winfo_screenheight())
+        
         # Set window icon
         try:
             import os
@@ -77,7 +155,7 @@ class MainWindow:
             logger.error(f"Error setting window icon: {str(e)}")
             
         # Set window to always be on top if configured
-        if self.app.settings.get("ui", "always_on_top", False):
+        if self._always_on_top:
             self.window.attributes('-topmost', True)
             
         # Set window opacity
@@ -123,77 +201,56 @@ class MainWindow:
         
     def _create_toolbar_buttons(self) -> None:
         """Create modern toolbar buttons"""
-        button_size = 40
-        button_padding = 8
-        
-        # Left-aligned buttons
-        self.btn_new = self._create_tool_button(
-            self.toolbar, "New Note", self.on_new_note,
-            "➕", button_size, 0
-        )
-        
-        self.btn_settings = self._create_tool_button(
-            self.toolbar, "Settings", self.on_settings,
-            "⚙", button_size, 1
-        )
-        
-        self.btn_plugins = self._create_tool_button(
-            self.toolbar, "Plugins", self.on_plugins,
-            "🔌", button_size, 2
-        )
-        
-        # Right-aligned buttons
-        self.btn_minimize = self._create_tool_button(
-            self.toolbar, "Minimize", self.hide,
-            "—", button_size, -1, True
-        )
-        
-        self.btn_close = self._create_tool_button(
-            self.toolbar, "Close", self.on_window_close,
-            "✕", button_size, -2, True
-        )
-        
-    def _create_tool_button(self, parent, tooltip, command, text, size, position, right_align=False) -> ttk.Button:
-        """Create a toolbar button"""
-        button_frame = ttk.Frame(parent)
-        
-        if right_align:
-            button_frame.pack(side=tk.RIGHT, padx=2)
-        else:
-            button_frame.pack(side=tk.LEFT, padx=2)
+        for attr, tooltip, text, method, side in self._TOOLBAR_BUTTONS:
+            button = self._create_tool_button(
+                self.toolbar, tooltip, getattr(self, method), text, side
+            )
+            setattr(self, attr, button)
             
+    def _create_tool_button(self, parent, tooltip, command, text, side=tk.LEFT) -> ttk.Button:
+        """Create a toolbar button"""
         button = ttk.Button(
-            button_frame, 
+            parent, 
             text=text,
             width=3,
             style="Modern.TButton",
             command=command
         )
-        button.pack(padx=2, pady=2)
+        button.pack(side=side, padx=4, pady=2)
         
         # Add tooltip using a simple hover event
-        def show_tooltip(event, tip=tooltip):
-            x, y, _, _ = button.bbox("insert")
-            x += button.winfo_rootx() + 25
-            y += button.winfo_rooty() + 25
-            
-            # Create a toplevel window
-            self.tooltip = tk.Toplevel(button)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{x}+{y}")
-            
-            label = ttk.Label(self.tooltip, text=tip, background="#ffffe0", relief="solid", borderwidth=1)
-            label.pack()
-            
-        def hide_tooltip(event):
-            if hasattr(self, "tooltip"):
-                self.tooltip.destroy()
-                
-        button.bind("<Enter>", show_tooltip)
-        button.bind("<Leave>", hide_tooltip)
+        button.bind("<Enter>", lambda event, tip=tooltip: self._show_tooltip(button, tip))
+        button.bind("<Leave>", lambda event: self._hide_tooltip())
         
         return button
         
+    def _show_tooltip(self, widget: tk.Widget, text: str) -> None:
+        """Show the shared tooltip window below a widget
+        
+        Args:
+            widget: Widget the pointer entered
+            text: Tooltip text
+        """
+        # One tooltip window is created and then reused for every hover
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self.window)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_label = ttk.Label(self._tooltip, background="#ffffe0", relief="solid", borderwidth=1)
+            self._tooltip_label.pack()
+            
+        x = widget.winfo_rootx() + 25
+        y = widget.winfo_rooty() + 25
+        
+        self._tooltip_label.configure(text=text)
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+        
+    def _hide_tooltip(self) -> None:
+        """Hide the shared tooltip window"""
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+            
     def _create_content_area(self) -> None:
         """Create the main content area"""
         # Create content frame with tabs
@@ -226,27 +283,47 @@ class MainWindow:
         self.history_list_frame = ttk.Frame(self.history_frame, style="Modern.TFrame")
         self.history_list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Create listbox with scrollbar
+        # Create history tree with scrollbar
         self.history_scrollbar = ttk.Scrollbar(self.history_list_frame)
         self.history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.history_listbox = tk.Listbox(
+        theme = self._theme_cache
+        style = self.app.theme_manager.ttk_style
+        if style:
+            style.configure(
+                "History.Treeview",
+                background=theme["bg"],
+                fieldbackground=theme["bg"],
+                foreground=theme["fg"],
+                font=theme["font"],
+                borderwidth=0
+            )
+            style.map(
+                "History.Treeview",
+                background=[("selected", theme["accent"])],
+                foreground=[("selected", "#FFFFFF")]
+            )
+            
+        self.history_tree = ttk.Treeview(
             self.history_list_frame,
-            bg=self.app.theme_manager.themes["light"]["colors"]["background"],
-            fg=self.app.theme_manager.themes["light"]["colors"]["foreground"],
-            selectbackground=self.app.theme_manager.themes["light"]["colors"]["accent"],
-            selectforeground="#FFFFFF",
-            font=self.app.theme_manager.themes["light"]["fonts"]["main"],
-            bd=0,
-            highlightthickness=0,
+            columns=("preview",),
+            show="tree",
+            selectmode="browse",
+            style="History.Treeview",
             yscrollcommand=self.history_scrollbar.set
         )
-        self.history_listbox.pack(fill=tk.BOTH, expand=True)
-        self.history_scrollbar.config(command=self.history_listbox.yview)
+        self.history_tree.pack(fill=tk.BOTH, expand=True)
+        self.history_scrollbar.config(command=self.history_tree.yview)
+        
+        # Row iids in display order (newest first), and the item behind each row
+        self._history_iids: List[str] = []
+        self._history_items: Dict[str, Any] = {}
+        self._history_iid_by_item: Dict[int, str] = {}
+        self._history_counter = 0
         
         # Bind events
-        self.history_listbox.bind("<Double-1>", self.on_history_item_double_click)
-        self.history_listbox.bind("<Button-3>", self.on_history_item_right_click)
+        self.history_tree.bind("<Double-1>", self.on_history_item_double_click)
+        self.history_tree.bind("<Button-3>", self.on_history_item_right_click)
         
     def _create_notes_content(self) -> None:
         """Create notes content"""
@@ -259,7 +336,7 @@ class MainWindow:
         
         self.notes_canvas = tk.Canvas(
             self.notes_frame_outer,
-            bg=self.app.theme_manager.themes["light"]["colors"]["background"],
+            bg=self._theme_cache["bg"],
             bd=0,
             highlightthickness=0,
             yscrollcommand=self.notes_scrollbar.set
@@ -281,7 +358,15 @@ class MainWindow:
         self.notes_canvas.bind("<Configure>", self._on_notes_canvas_configure)
         
         # Bind mouse wheel scrolling
-        self.notes_canvas.bind_all("<MouseWheel>", self._on_notes_mousewheel)
+        # Wheel scrolling goes through a bind tag shared by the canvas and
+        # the note widgets, so it does not capture wheel events app-wide
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.notes_canvas.bind_class(NOTES_SCROLL_TAG, sequence, self._on_notes_mousewheel)
+        self._add_notes_scroll_tag(self.notes_canvas)  # Includes the inner frame
+        
+        # Note content clicks share one handler per event
+        self.notes_canvas.bind_class(NOTE_CONTENT_TAG, "<Button-1>", self._on_note_content_click)
+        self.notes_canvas.bind_class(NOTE_CONTENT_TAG, "<Button-3>", self._on_note_content_right_click)
         
         # Add a note button
         self.add_note_frame = ttk.Frame(self.notes_frame_outer, style="Modern.TFrame")
@@ -305,9 +390,29 @@ class MainWindow:
         canvas_width = event.width
         self.notes_canvas.itemconfig(self.notes_canvas_window, width=canvas_width)
         
+        # Re-wrap the note text to the new width
+        wraplength = max(50, canvas_width - NOTE_WRAP_MARGIN)
+        if wraplength != self._note_wraplength:
+            self._note_wraplength = wraplength
+            for row in self._note_widgets.values():
+                row["content_label"].configure(wraplength=wraplength)
+                
     def _on_notes_mousewheel(self, event) -> None:
         """Handle mouse wheel scrolling on notes canvas"""
-        self.notes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # X11 reports the wheel as buttons 4 (up) and 5 (down)
+        if event.num == 4:
+            self.notes_canvas.yview_scroll(-1, "units")
+        elif event.num == 5:
+            self.notes_canvas.yview_scroll(1, "units")
+        else:
+            self.notes_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            
+    @staticmethod
+    def _add_notes_scroll_tag(widget: tk.Misc) -> None:
+        """Add the notes scroll bind tag to a widget and its descendants"""
+        widget.bindtags((NOTES_SCROLL_TAG,) + widget.bindtags())
+        for child in widget.winfo_children():
+            MainWindow._add_notes_scroll_tag(child)
         
     def _create_status_bar(self) -> None:
         """Create status bar at the bottom of the window"""
@@ -387,15 +492,14 @@ class MainWindow:
             
         # Get current window geometry
         geometry = self.window.geometry()
-        match = tk.re.match(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)', geometry)
+        match = _GEOMETRY_RE.match(geometry)
         if not match:
             return
             
         width, height, x, y = map(int, match.groups())
         
         # Get screen dimensions
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+        screen_width, screen_height = self._screen_size
         
         # Determine collapse position
         position = self.auto_collapse_position
@@ -447,71 +551,201 @@ class MainWindow:
         self.collapsed = False
         
     def refresh_history(self) -> None:
-        """Refresh clipboard history"""
-        # Clear listbox
-        self.history_listbox.delete(0, tk.END)
-        
-        # Get history from clipboard manager
-        history = self.app.clipboard_manager.history
-        
-        # Add items to listbox in reverse order (newest first)
-        for item in reversed(history):
-            # Truncate long items for display
-            display_text = str(item)
-            if len(display_text) > 60:
-                display_text = display_text[:57] + "..."
+        """Schedule a history refresh, coalescing repeated calls until idle"""
+        if self._refresh_history_pending:
+            return
+        self._refresh_history_pending = True
+        self.window.after_idle(self._flush_refresh_history)
+        
+    def _flush_refresh_history(self) -> None:
+        """Run the scheduled history refresh"""
+        self._refresh_history_pending = False
+        self._do_refresh_history()
+        
+    def _do_refresh_history(self) -> None:
+        """Refresh clipboard history
+        
+        Only rows whose items were added, removed or moved are touched.
+        """
+        tree = self.history_tree
+        
+        # Get history from clipboard manager, newest first
+        history = list(reversed(self.app.clipboard_manager.history))
+        live = {id(item) for item in history}
+        
+        # Delete rows of items that left the history
+        gone = [iid for iid in self._history_iids if id(self._history_items[iid]) not in live]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone:
+                del self._history_iid_by_item[id(self._history_items.pop(iid))]
+            gone_set = set(gone)
+            self._history_iids = [iid for iid in self._history_iids if iid not in gone_set]
+            
+        # Insert new items and move the ones that changed position
+        shown = self._history_iids
+        for index, item in enumerate(history):
+            iid = self._history_iid_by_item.get(id(item))
+            if index < len(shown) and shown[index] == iid:
+                continue
                 
-            self.history_listbox.insert(tk.END, display_text)
+            if iid is None:
+                self._history_counter += 1
+                iid = f"h{self._history_counter}"
+                self._history_items[iid] = item
+                self._history_iid_by_item[id(item)] = iid
+                tree.insert("", index, iid=iid, text=self._history_preview(item))
+            else:
+                shown.remove(iid)
+                tree.move(iid, "", index)
+            shown.insert(index, iid)
             
+    @staticmethod
+    def _history_preview(item: Any) -> str:
+        """Get the display text of a history item
+        
+        Computed once per row, when the row is inserted.
+        """
+        # Truncate long items for display
+        display_text = str(item)
+        if len(display_text) > 60:
+            display_text = display_text[:57] + "..."
+        return display_text
+        
     def refresh_notes(self) -> None:
-        """Refresh notes display"""
-        # Clear all notes
-        for widget in self.notes_inner_frame.winfo_children():
-            widget.destroy()
-            
+        """Schedule a notes refresh, coalescing repeated calls until idle"""
+        if self._refresh_notes_pending:
+            return
+        self._refresh_notes_pending = True
+        self.window.after_idle(self._flush_refresh_notes)
+        
+    def _flush_refresh_notes(self) -> None:
+        """Run the scheduled notes refresh"""
+        self._refresh_notes_pending = False
+        self._do_refresh_notes()
+        
+    def _do_refresh_notes(self) -> None:
+        """Refresh notes display
+        
+        Rows are kept between refreshes and only created, destroyed,
+        updated or re-packed where the notes actually changed.
+        """
         # Get notes from settings
         sticky_notes = self.app.settings.get_sticky_notes()
         regular_notes = self.app.settings.get_notes()
         
-        # Add sticky notes first with label
+        live_ids = {note.get("id") for note in sticky_notes}
+        live_ids.update(note.get("id") for note in regular_notes)
+        
+        # Drop rows of notes that no longer exist
+        for note_id in [nid for nid in self._note_widgets if nid not in live_ids]:
+            row = self._note_widgets.pop(note_id)
+            del self._note_by_label[str(row["content_label"])]
+            row["frame"].destroy()
+            
+        # Work out the packing order: each section label followed by its rows
+        order = []
         if sticky_notes:
-            sticky_label = ttk.Label(
-                self.notes_inner_frame,
-                text="Pinned Notes",
-                style="Modern.Title.TLabel"
-            )
-            sticky_label.pack(fill=tk.X, padx=5, pady=(10, 5))
+            order.append(self._section_label("pinned", "Pinned Notes"))
+            order.extend(self._note_row_frame(note, True) for note in sticky_notes)
             
-            for note in sticky_notes:
-                self._create_note_widget(note, True)
-                
-        # Add regular notes with label if there are any
         if regular_notes:
-            regular_label = ttk.Label(
+            order.append(self._section_label("notes", "Notes"))
+            order.extend(self._note_row_frame(note, False) for note in regular_notes)
+            
+        # Re-pack from the first widget that is out of place
+        current = self.notes_inner_frame.pack_slaves()
+        first_diff = 0
+        while (first_diff < len(order) and first_diff < len(current)
+               and str(current[first_diff]) == str(order[first_diff])):
+            first_diff += 1
+            
+        if first_diff == len(order) == len(current):
+            return
+            
+        # Keep the inner frame unmapped while it is re-packed so the rows
+        # are laid out and drawn once, not after every pack call
+        self.notes_canvas.itemconfigure(self.notes_canvas_window, state="hidden")
+        for widget in current[first_diff:]:
+            widget.pack_forget()
+        for widget in order[first_diff:]:
+            if widget is self._pinned_section or widget is self._notes_section:
+                widget.pack(fill=tk.X, padx=5, pady=(10, 5))
+            else:
+                widget.pack(fill=tk.X, padx=5, pady=5, ipady=5)
+        self.notes_canvas.itemconfigure(self.notes_canvas_window, state="normal")
+        
+        # The scroll region follows from _on_notes_frame_configure once
+        # the new layout has been computed
+        
+    def _note_row_frame(self, note: Dict, is_sticky: bool) -> ttk.Frame:
+        """Get the up to date row frame of a note, creating the row if needed"""
+        row = self._note_widgets.get(note.get("id"))
+        if row is None:
+            row = self._create_note_widget(note, is_sticky)
+        else:
+            self._update_note_widget(row, note, is_sticky)
+        return row["frame"]
+        
+    def _section_label(self, section: str, text: str) -> ttk.Label:
+        """Get the heading label of a notes section, creating it on first use
+        
+        Args:
+            section: "pinned" or "notes"
+            text: Heading text
+        """
+        attr = "_pinned_section" if section == "pinned" else "_notes_section"
+        label = getattr(self, attr)
+        if label is None:
+            label = ttk.Label(
                 self.notes_inner_frame,
-                text="Notes",
+                text=text,
                 style="Modern.Title.TLabel"
             )
-            regular_label.pack(fill=tk.X, padx=5, pady=(10, 5))
+            self._add_notes_scroll_tag(label)
+            setattr(self, attr, label)
+        return label
+        
+    def refresh_note(self, note_id: str) -> None:
+        """Update the row of a single note whose content changed
+        
+        Falls back to refresh_notes when the note was added, removed or
+        moved between the pinned and regular sections.
+        
+        Args:
+            note_id: ID of the note to refresh
+        """
+        # A pending full refresh will pick the change up
+        if self._refresh_notes_pending:
+            return
             
-            for note in regular_notes:
-                self._create_note_widget(note, False)
-                
-        # Update canvas scroll region
-        self.notes_canvas.update_idletasks()
-        self.notes_canvas.configure(scrollregion=self.notes_canvas.bbox("all"))
-                
-    def _create_note_widget(self, note: Dict, is_sticky: bool) -> None:
+        row = self._note_widgets.get(note_id)
+        note = self.app.settings.get_note(note_id)
+        if row is None or note is None or self.app.settings.is_note_sticky(note_id) != row["sticky"]:
+            self.refresh_notes()
+            return
+            
+        self._update_note_widget(row, note, row["sticky"])
+        
+    def _create_note_widget(self, note: Dict, is_sticky: bool) -> Dict[str, Any]:
         """Create a note widget
         
+        The row frame is left unpacked, refresh_notes places it.
+        
         Args:
             note: Note data dictionary
             is_sticky: Whether this is a sticky note
+            
+        Returns:
+            Row dictionary with the widgets and the values they show
         """
         note_id = note.get("id")
         content = note.get("content", "")
         created = note.get("created", {}).get("date", "")
         
+        # Handlers read the row so they see content updated in place
+        row: Dict[str, Any] = {"id": note_id, "content": content, "sticky": is_sticky}
+        
         # Create note frame
         note_frame = ttk.Frame(
             self.notes_inner_frame,
@@ -519,7 +753,6 @@ class MainWindow:
             borderwidth=1,
             relief=tk.SOLID
         )
-        note_frame.pack(fill=tk.X, padx=5, pady=5, ipady=5)
         
         # Create top bar with tools
         top_bar = ttk.Frame(note_frame, style="Modern.TFrame")
@@ -527,12 +760,11 @@ class MainWindow:
         
         # Add sticky/unsticky button
         sticky_text = "📌" if not is_sticky else "📍"
-        sticky_tip = "Pin Note" if not is_sticky else "Unpin Note"
         sticky_btn = ttk.Button(
             top_bar, 
             text=sticky_text,
             width=3,
-            command=lambda nid=note_id: self.on_toggle_sticky(nid)
+            command=partial(self.on_toggle_sticky, note_id)
         )
         sticky_btn.pack(side=tk.LEFT, padx=2)
         
@@ -541,7 +773,7 @@ class MainWindow:
             top_bar, 
             text="✏️",
             width=3,
-            command=lambda nid=note_id, c=content: self.on_edit_note(nid, c)
+            command=partial(self._on_edit_note_row, row)
         )
         edit_btn.pack(side=tk.LEFT, padx=2)
         
@@ -549,7 +781,7 @@ class MainWindow:
             top_bar, 
             text="🗑️",
             width=3,
-            command=lambda nid=note_id: self.on_delete_note(nid)
+            command=partial(self.on_delete_note, note_id)
         )
         delete_btn.pack(side=tk.LEFT, padx=2)
         
@@ -561,7 +793,7 @@ class MainWindow:
             move_frame, 
             text="⏫",
             width=3,
-            command=lambda nid=note_id: self.on_move_note(nid, "top")
+            command=partial(self.on_move_note, note_id, "top")
         )
         top_btn.pack(side=tk.LEFT, padx=1)
         
@@ -569,7 +801,7 @@ class MainWindow:
             move_frame, 
             text="🔼",
             width=3,
-            command=lambda nid=note_id: self.on_move_note(nid, "up")
+            command=partial(self.on_move_note, note_id, "up")
         )
         up_btn.pack(side=tk.LEFT, padx=1)
         
@@ -577,7 +809,7 @@ class MainWindow:
             move_frame, 
             text="🔽",
             width=3,
-            command=lambda nid=note_id: self.on_move_note(nid, "down")
+            command=partial(self.on_move_note, note_id, "down")
         )
         down_btn.pack(side=tk.LEFT, padx=1)
         
@@ -585,7 +817,7 @@ class MainWindow:
             move_frame, 
             text="⏬",
             width=3,
-            command=lambda nid=note_id: self.on_move_note(nid, "bottom")
+            command=partial(self.on_move_note, note_id, "bottom")
         )
         bottom_btn.pack(side=tk.LEFT, padx=1)
         
@@ -598,31 +830,75 @@ class MainWindow:
             content_frame,
             text=content,
             style="Modern.TLabel",
-            wraplength=350  # Set wraplength to handle long text
+            wraplength=self._note_wraplength  # Follows the canvas width
         )
         content_label.pack(fill=tk.X, padx=5, pady=5)
         
-        # Add click handling for copy to clipboard
-        content_label.bind(
-            "<Button-1>", 
-            lambda event, c=content, nid=note_id: self.on_note_click(c, nid)
-        )
-        
-        # Add right-click context menu
-        content_label.bind(
-            "<Button-3>",
-            lambda event, nid=note_id, c=content: self.on_note_right_click(event, nid, c)
-        )
+        # Click to copy and right-click menu come from the shared
+        # NoteContent bindings, which find the row by widget path
+        content_label.bindtags((NOTE_CONTENT_TAG,) + content_label.bindtags())
+        self._note_by_label[str(content_label)] = row
         
         # Add date/time in small text if available
+        date_label = None
         if created:
             date_label = ttk.Label(
                 note_frame,
                 text=f"Created: {created}",
                 style="Status.TLabel",
-                font=("Segoe UI", 8)
+                font=NOTE_DATE_FONT
             )
             date_label.pack(fill=tk.X, padx=5, pady=(0, 5), anchor=tk.E)
+            
+        self._add_notes_scroll_tag(note_frame)
+        
+        row.update(
+            frame=note_frame,
+            sticky_btn=sticky_btn,
+            content_label=content_label,
+            date_label=date_label,
+            created=created
+        )
+        self._note_widgets[note_id] = row
+        return row
+        
+    def _update_note_widget(self, row: Dict[str, Any], note: Dict, is_sticky: bool) -> None:
+        """Reconfigure an existing note row to match the note
+        
+        Args:
+            row: Row dictionary from _create_note_widget
+            note: Note data dictionary
+            is_sticky: Whether this is a sticky note
+        """
+        content = note.get("content", "")
+        if content != row["content"]:
+            row["content"] = content
+            row["content_label"].configure(text=content)
+            
+        if is_sticky != row["sticky"]:
+            row["sticky"] = is_sticky
+            row["sticky_btn"].configure(text="📌" if not is_sticky else "📍")
+            
+        created = note.get("created", {}).get("date", "")
+        if created != row["created"] and row["date_label"] is not None:
+            row["created"] = created
+            row["date_label"].configure(text=f"Created: {created}")
+            
+    def _on_note_content_click(self, event) -> None:
+        """Copy the note whose content label was clicked"""
+        row = self._note_by_label.get(str(event.widget))
+        if row is not None:
+            self.on_note_click(row["content"], row["id"])
+            
+    def _on_note_content_right_click(self, event) -> None:
+        """Show the context menu of the note whose content label was clicked"""
+        row = self._note_by_label.get(str(event.widget))
+        if row is not None:
+            self.on_note_right_click(event, row["id"], row["content"])
+            
+    def _on_edit_note_row(self, row: Dict[str, Any]) -> None:
+        """Edit the note of a row with the content it currently shows"""
+        self.on_edit_note(row["id"], row["content"])
         
     def on_note_click(self, content: str, note_id: str) -> None:
         """Handle note click - copy to clipboard
@@ -724,7 +1000,7 @@ class MainWindow:
             note_id: ID of the note to delete
         """
         # Confirm deletion if setting enabled
-        if self.app.settings.get("general", "confirm_delete", True):
+        if self._confirm_delete:
             if not messagebox.askyesno("Delete Note", 
                                      "Are you sure you want to delete this note?",
                                      parent=self.window):
@@ -739,21 +1015,12 @@ class MainWindow:
     
     def on_history_item_double_click(self, event) -> None:
         """Handle double-click on history item"""
-        # Get selected item index
-        selected_index = self.history_listbox.curselection()
+        # Get the clicked item
+        item = self._history_items.get(self.history_tree.identify_row(event.y))
         
-        if not selected_index:
+        if item is None:
             return
             
-        # Get actual item from clipboard history (accounting for reverse order)
-        history = self.app.clipboard_manager.history
-        real_index = len(history) - 1 - selected_index[0]
-        
-        if real_index < 0 or real_index >= len(history):
-            return
-            
-        item = history[real_index]
-        
         # Copy to clipboard
         self.app.clipboard_manager.copy_to_clipboard(item)
         
@@ -761,34 +1028,30 @@ class MainWindow:
         self.status_label.config(text="Copied to clipboard")
         
         # Hide window after paste if enabled
-        if self.app.settings.get("general", "hide_after_paste", True):
+        if self._hide_after_paste:
             self.hide()
         
     def on_history_item_right_click(self, event) -> None:
         """Handle right-click on history item"""
         # Get the item under the cursor
-        item_index = self.history_listbox.nearest(event.y)
-        self.history_listbox.selection_clear(0, tk.END)
-        self.history_listbox.selection_set(item_index)
-        
-        # Get actual item from clipboard history (accounting for reverse order)
-        history = self.app.clipboard_manager.history
-        real_index = len(history) - 1 - item_index
+        iid = self.history_tree.identify_row(event.y)
+        item = self._history_items.get(iid)
         
-        if real_index < 0 or real_index >= len(history):
+        if item is None:
             return
             
-        item = history[real_index]
+        self.history_tree.selection_set(iid)
+        self.history_tree.focus(iid)
         
         # Create menu
         popup = tk.Menu(self.window, tearoff=0)
         popup.add_command(label="Copy to Clipboard", 
-                         command=lambda: self._copy_history_item(real_index))
+                         command=lambda: self._copy_history_item(item))
         popup.add_command(label="Save as Note", 
                          command=lambda: self._save_history_item_as_note(item))
         popup.add_separator()
         popup.add_command(label="Delete", 
-                         command=lambda: self._delete_history_item(real_index))
+                         command=lambda: self._delete_history_item(item))
         
         # Display menu
         try:
@@ -796,15 +1059,13 @@ class MainWindow:
         finally:
             popup.grab_release()
             
-    def _copy_history_item(self, index: int) -> None:
+    def _copy_history_item(self, item: Any) -> None:
         """Copy a history item to clipboard
         
         Args:
-            index: Index of the item in the history list
+            item: Clipboard item from the history
         """
-        history = self.app.clipboard_manager.history
-        if 0 <= index < len(history):
-            item = history[index]
+        if item in self.app.clipboard_manager.history:
             self.app.clipboard_manager.copy_to_clipboard(item)
             self.status_label.config(text="Copied to clipboard")
             
@@ -820,23 +1081,22 @@ class MainWindow:
         else:
             self.status_label.config(text="Failed to save note")
             
-    def _delete_history_item(self, index: int) -> None:
+    def _delete_history_item(self, item: Any) -> None:
         """Delete a history item
         
         Args:
-            index: Index of the item to delete
+            item: Clipboard item to delete
         """
-        history = self.app.clipboard_manager.history
-        if 0 <= index < len(history):
+        if item in self.app.clipboard_manager.history:
             # Request confirmation if enabled
-            if self.app.settings.get("general", "confirm_delete", True):
+            if self._confirm_delete:
                 if not messagebox.askyesno("Delete Item", 
                                          "Are you sure you want to delete this item?",
                                          parent=self.window):
                     return
                     
             # Delete the item
-            del self.app.clipboard_manager.history[index]
+            self.app.clipboard_manager.remove_item(item)
             self.refresh_history()
             self.status_label.config(text="Item deleted")
     
@@ -860,12 +1120,20 @@ class MainWindow:
         """Open settings dialog"""
         self.status_label.config(text="Opening settings...")
         
+        # Reuse the dialog built by an earlier call, with fresh values
+        if self._settings_window is not None and self._settings_window.winfo_exists():
+            self._reload_settings_dialog()
+            self._show_dialog(self._settings_window)
+            return
+            
         # Create settings dialog - a simple implementation
         settings_window = tk.Toplevel(self.window)
+        settings_window.withdraw()
         settings_window.title("Settings")
         settings_window.geometry("500x400")
         settings_window.transient(self.window)
-        settings_window.grab_set()
+        settings_window.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(settings_window))
+        self._settings_window = settings_window
         
         # Add settings notebook for tabs
         notebook = ttk.Notebook(settings_window)
@@ -887,196 +1155,225 @@ class MainWindow:
         collapse_frame = ttk.Frame(notebook)
         notebook.add(collapse_frame, text="Auto-Collapse")
         
-        # Fill general settings
-        row = 0
-        ttk.Label(general_frame, text="Clipboard Settings", font=("Segoe UI", 10, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(10, 5)
-        )
-        row += 1
-        
-        # Max history items
-        ttk.Label(general_frame, text="Max history items:").grid(
-            row=row, column=0, sticky="w", padx=5, pady=2
-        )
-        max_history_var = tk.IntVar(value=self.app.settings.get("general", "max_history_items", 100))
-        ttk.Spinbox(
-            general_frame, 
-            from_=10, 
-            to=1000, 
-            increment=10, 
-            textvariable=max_history_var
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Poll interval
-        ttk.Label(general_frame, text="Clipboard poll interval (s):").grid(
-            row=row, column=0, sticky="w", padx=5, pady=2
-        )
-        poll_interval_var = tk.DoubleVar(
-            value=self.app.settings.get("general", "clipboard_poll_interval", 0.5)
-        )
-        ttk.Spinbox(
-            general_frame, 
-            from_=0.1, 
-            to=5.0, 
-            increment=0.1, 
-            textvariable=poll_interval_var,
-            format="%.1f"
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Startup settings section
-        ttk.Label(general_frame, text="Startup Settings", font=("Segoe UI", 10, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(10, 5)
-        )
-        row += 1
-        
-        # Start minimized
-        start_minimized_var = tk.BooleanVar(
-            value=self.app.settings.get("general", "start_minimized", False)
-        )
-        ttk.Checkbutton(
-            general_frame, 
-            text="Start minimized", 
-            variable=start_minimized_var
-        ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
-        row += 1
-        
-        # Start with system
-        start_with_system_var = tk.BooleanVar(
-            value=self.app.settings.get("general", "start_with_system", False)
-        )
-        ttk.Checkbutton(
-            general_frame, 
-            text="Start with system", 
-            variable=start_with_system_var
-        ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
-        row += 1
-        
-        # Notes settings section
-        ttk.Label(general_frame, text="Notes Settings", font=("Segoe UI", 10, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(10, 5)
-        )
-        row += 1
-        
-        # Last used to top
-        last_used_to_top_var = tk.BooleanVar(
-            value=self.app.settings.get("general", "last_used_to_top", True)
-        )
-        ttk.Checkbutton(
-            general_frame, 
-            text="Move last used note to top", 
-            variable=last_used_to_top_var
-        ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
-        row += 1
-        
-        # Fill UI settings tab
-        row = 0
-        ttk.Label(ui_frame, text="Window Settings", font=("Segoe UI", 10, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(10, 5)
-        )
-        row += 1
-        
-        # Opacity
-        ttk.Label(ui_frame, text="Window opacity:").grid(
-            row=row, column=0, sticky="w", padx=5, pady=2
-        )
-        opacity_var = tk.DoubleVar(value=self.app.settings.get("ui", "opacity", 0.98))
-        ttk.Scale(
-            ui_frame,
-            from_=0.5,
-            to=1.0,
-            variable=opacity_var,
-            orient=tk.HORIZONTAL,
-            length=200
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Always on top
-        always_on_top_var = tk.BooleanVar(
-            value=self.app.settings.get("ui", "always_on_top", False)
-        )
-        ttk.Checkbutton(
-            ui_frame, 
-            text="Always on top", 
-            variable=always_on_top_var
-        ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
-        row += 1
-        
-        # Fill auto-collapse tab
-        row = 0
-        ttk.Label(collapse_frame, text="Auto-Collapse Settings", font=("Segoe UI", 10, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(10, 5)
-        )
-        row += 1
-        
-        # Enable auto-collapse
-        enable_collapse_var = tk.BooleanVar(
-            value=self.app.settings.get("ui", "enable_auto_collapse", True)
-        )
-        ttk.Checkbutton(
-            collapse_frame, 
-            text="Enable auto-collapse", 
-            variable=enable_collapse_var
-        ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
-        row += 1
-        
-        # Collapse position
-        ttk.Label(collapse_frame, text="Collapse position:").grid(
-            row=row, column=0, sticky="w", padx=5, pady=2
-        )
-        position_var = tk.StringVar(
-            value=self.app.settings.get("general", "auto_collapse", {}).get("position", "right")
-        )
-        ttk.Combobox(
-            collapse_frame, 
-            textvariable=position_var,
-            values=["right", "left", "top", "bottom"],
-            state="readonly",
-            width=15
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
-        
-        # Collapse delay
-        ttk.Label(collapse_frame, text="Collapse delay (s):").grid(
-            row=row, column=0, sticky="w", padx=5, pady=2
-        )
-        delay_var = tk.DoubleVar(
-            value=self.app.settings.get("general", "auto_collapse", {}).get("delay_seconds", 1.5)
-        )
-        ttk.Spinbox(
-            collapse_frame, 
-            from_=0.5, 
-            to=10.0, 
-            increment=0.5, 
-            textvariable=delay_var,
-            format="%.1f"
-        ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-        row += 1
+        # The variables exist up front so save_settings can read every
+        # field, the widgets of each tab are only built when it is shown
+        max_history_var = tk.IntVar()
+        poll_interval_var = tk.DoubleVar()
+        start_minimized_var = tk.BooleanVar()
+        start_with_system_var = tk.BooleanVar()
+        last_used_to_top_var = tk.BooleanVar()
+        opacity_var = tk.DoubleVar()
+        always_on_top_var = tk.BooleanVar()
+        enable_collapse_var = tk.BooleanVar()
+        position_var = tk.StringVar()
+        delay_var = tk.DoubleVar()
+        
+        def reload_vars():
+            """Seed the variables from the current settings"""
+            # Read the current values once for the whole dialog
+            general = self.app.settings.get_section("general")
+            ui = self.app.settings.get_section("ui")
+            auto_collapse = general.get("auto_collapse", {})
+            
+            max_history_var.set(general.get("max_history_items", 100))
+            poll_interval_var.set(general.get("clipboard_poll_interval", 0.5))
+            start_minimized_var.set(general.get("start_minimized", False))
+            start_with_system_var.set(general.get("start_with_system", False))
+            last_used_to_top_var.set(general.get("last_used_to_top", True))
+            opacity_var.set(ui.get("opacity", 0.98))
+            always_on_top_var.set(ui.get("always_on_top", False))
+            enable_collapse_var.set(ui.get("enable_auto_collapse", True))
+            position_var.set(auto_collapse.get("position", "right"))
+            delay_var.set(auto_collapse.get("delay_seconds", 1.5))
+            
+        reload_vars()
+        self._reload_settings_dialog = reload_vars
+        
+        def build_general():
+            """Fill general settings"""
+            row = 0
+            ttk.Label(general_frame, text="Clipboard Settings", font=("Segoe UI", 10, "bold")).grid(
+                row=row, column=0, sticky="w", padx=5, pady=(10, 5)
+            )
+            row += 1
+            
+            # Max history items
+            ttk.Label(general_frame, text="Max history items:").grid(
+                row=row, column=0, sticky="w", padx=5, pady=2
+            )
+            ttk.Spinbox(
+                general_frame, 
+                from_=10, 
+                to=1000, 
+                increment=10, 
+                textvariable=max_history_var
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            row += 1
+            
+            # Poll interval
+            ttk.Label(general_frame, text="Clipboard poll interval (s):").grid(
+                row=row, column=0, sticky="w", padx=5, pady=2
+            )
+            ttk.Spinbox(
+                general_frame, 
+                from_=0.1, 
+                to=5.0, 
+                increment=0.1, 
+                textvariable=poll_interval_var,
+                format="%.1f"
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            row += 1
+            
+            # Startup settings section
+            ttk.Label(general_frame, text="Startup Settings", font=("Segoe UI", 10, "bold")).grid(
+                row=row, column=0, sticky="w", padx=5, pady=(10, 5)
+            )
+            row += 1
+            
+            # Start minimized
+            ttk.Checkbutton(
+                general_frame, 
+                text="Start minimized", 
+                variable=start_minimized_var
+            ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
+            row += 1
+            
+            # Start with system
+            ttk.Checkbutton(
+                general_frame, 
+                text="Start with system", 
+                variable=start_with_system_var
+            ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
+            row += 1
+            
+            # Notes settings section
+            ttk.Label(general_frame, text="Notes Settings", font=("Segoe UI", 10, "bold")).grid(
+                row=row, column=0, sticky="w", padx=5, pady=(10, 5)
+            )
+            row += 1
+            
+            # Last used to top
+            ttk.Checkbutton(
+                general_frame, 
+                text="Move last used note to top", 
+                variable=last_used_to_top_var
+            ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
+            row += 1
+            
+        def build_ui():
+            """Fill UI settings tab"""
+            row = 0
+            ttk.Label(ui_frame, text="Window Settings", font=("Segoe UI", 10, "bold")).grid(
+                row=row, column=0, sticky="w", padx=5, pady=(10, 5)
+            )
+            row += 1
+            
+            # Opacity
+            ttk.Label(ui_frame, text="Window opacity:").grid(
+                row=row, column=0, sticky="w", padx=5, pady=2
+            )
+            ttk.Scale(
+                ui_frame,
+                from_=0.5,
+                to=1.0,
+                variable=opacity_var,
+                orient=tk.HORIZONTAL,
+                length=200
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            row += 1
+            
+            # Always on top
+            ttk.Checkbutton(
+                ui_frame, 
+                text="Always on top", 
+                variable=always_on_top_var
+            ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
+            row += 1
+            
+        def build_collapse():
+            """Fill auto-collapse tab"""
+            row = 0
+            ttk.Label(collapse_frame, text="Auto-Collapse Settings", font=("Segoe UI", 10, "bold")).grid(
+                row=row, column=0, sticky="w", padx=5, pady=(10, 5)
+            )
+            row += 1
+            
+            # Enable auto-collapse
+            ttk.Checkbutton(
+                collapse_frame, 
+                text="Enable auto-collapse", 
+                variable=enable_collapse_var
+            ).grid(row=row, column=0, sticky="w", padx=5, pady=2, columnspan=2)
+            row += 1
+            
+            # Collapse position
+            ttk.Label(collapse_frame, text="Collapse position:").grid(
+                row=row, column=0, sticky="w", padx=5, pady=2
+            )
+            ttk.Combobox(
+                collapse_frame, 
+                textvariable=position_var,
+                values=["right", "left", "top", "bottom"],
+                state="readonly",
+                width=15
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            row += 1
+            
+            # Collapse delay
+            ttk.Label(collapse_frame, text="Collapse delay (s):").grid(
+                row=row, column=0, sticky="w", padx=5, pady=2
+            )
+            ttk.Spinbox(
+                collapse_frame, 
+                from_=0.5, 
+                to=10.0, 
+                increment=0.5, 
+                textvariable=delay_var,
+                format="%.1f"
+            ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+            row += 1
+            
+        tab_builders = {
+            str(general_frame): build_general,
+            str(ui_frame): build_ui,
+            str(collapse_frame): build_collapse
+        }
+        
+        def on_tab_changed(event):
+            # Build a tab the first time it is selected
+            build = tab_builders.pop(notebook.select(), None)
+            if build:
+                build()
+                
+        # The first tab is built right away since it is shown on open
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed(None)
         
         # Buttons
         button_frame = ttk.Frame(settings_window)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
         def save_settings():
-            # Save all settings
-            # General settings
-            self.app.settings.set("general", "max_history_items", max_history_var.get())
-            self.app.settings.set("general", "clipboard_poll_interval", poll_interval_var.get())
-            self.app.settings.set("general", "start_minimized", start_minimized_var.get())
-            self.app.settings.set("general", "start_with_system", start_with_system_var.get())
-            self.app.settings.set("general", "last_used_to_top", last_used_to_top_var.get())
-            
-            # UI settings
-            self.app.settings.set("ui", "opacity", opacity_var.get())
-            self.app.settings.set("ui", "always_on_top", always_on_top_var.get())
-            
-            # Auto-collapse settings
-            self.app.settings.set("ui", "enable_auto_collapse", enable_collapse_var.get())
-            auto_collapse = self.app.settings.get("general", "auto_collapse", {})
-            auto_collapse["position"] = position_var.get()
-            auto_collapse["delay_seconds"] = delay_var.get()
-            self.app.settings.set("general", "auto_collapse", auto_collapse)
+            # Save all settings in one update
+            self.app.settings.update({
+                "general": {
+                    "max_history_items": max_history_var.get(),
+                    "clipboard_poll_interval": poll_interval_var.get(),
+                    "start_minimized": start_minimized_var.get(),
+                    "start_with_system": start_with_system_var.get(),
+                    "last_used_to_top": last_used_to_top_var.get(),
+                    "auto_collapse": dict(
+                        self.app.settings.get("general", "auto_collapse", {}),
+                        position=position_var.get(),
+                        delay_seconds=delay_var.get()
+                    )
+                },
+                "ui": {
+                    "opacity": opacity_var.get(),
+                    "always_on_top": always_on_top_var.get(),
+                    "enable_auto_collapse": enable_collapse_var.get()
+                }
+            })
             
             # Save settings
             self.app.settings.save()
@@ -1084,12 +1381,13 @@ class MainWindow:
             # Apply changes
             self.window.attributes('-topmost', always_on_top_var.get())
             self.window.attributes('-alpha', opacity_var.get())
-            self.auto_collapse_enabled = enable_collapse_var.get()
-            self.auto_collapse_position = position_var.get()
-            self.auto_collapse_delay = delay_var.get() * 1000
+            # Every open window caches these, not just this one
+            for window in self.app.windows:
+                window.refresh_cached_settings()
+            self.app.refresh_cached_settings()
             
             # Close dialog
-            settings_window.destroy()
+            self._close_dialog(settings_window)
             self.status_label.config(text="Settings saved")
             
             # Restart monitoring with new interval
@@ -1106,27 +1404,31 @@ class MainWindow:
         ttk.Button(
             button_frame, 
             text="Cancel", 
-            command=settings_window.destroy
+            command=lambda: self._close_dialog(settings_window)
         ).pack(side=tk.RIGHT, padx=5)
         
-        # Set window position relative to main window
-        settings_window.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - settings_window.winfo_width()) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - settings_window.winfo_height()) // 2
-        settings_window.geometry(f"+{max(0, x)}+{max(0, y)}")
+        self._show_dialog(settings_window)
         
     def on_plugins(self) -> None:
         """Open plugins dialog"""
+        # Reuse the dialog built by an earlier call, with fresh plugin data
+        if self._plugins_window is not None and self._plugins_window.winfo_exists():
+            self._reload_plugins_dialog()
+            self._show_dialog(self._plugins_window)
+            return
+            
         # Create plugins dialog
         plugins_window = tk.Toplevel(self.window)
+        plugins_window.withdraw()
         plugins_window.title("Plugins")
         plugins_window.geometry("500x400")
         plugins_window.transient(self.window)
-        plugins_window.grab_set()
+        plugins_window.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(plugins_window))
+        self._plugins_window = plugins_window
         
-        # Get plugins list
-        plugins = self.app.plugin_manager.get_plugins()
-        enabled_plugins = self.app.settings.get("plugins", "enabled", [])
+        # Plugins list, filled by reload_plugins
+        plugins = {}
+        enabled_plugins = []
         
         # Create main frame
         main_frame = ttk.Frame(plugins_window, style="Modern.TFrame")
@@ -1146,11 +1448,11 @@ class MainWindow:
         
         plugins_list = tk.Listbox(
             list_frame,
-            bg=self.app.theme_manager.themes["light"]["colors"]["background"],
-            fg=self.app.theme_manager.themes["light"]["colors"]["foreground"],
-            selectbackground=self.app.theme_manager.themes["light"]["colors"]["accent"],
+            bg=self._theme_cache["bg"],
+            fg=self._theme_cache["fg"],
+            selectbackground=self._theme_cache["accent"],
             selectforeground="#FFFFFF",
-            font=self.app.theme_manager.themes["light"]["fonts"]["main"],
+            font=self._theme_cache["font"],
             bd=1,
             highlightthickness=0,
             yscrollcommand=scrollbar.set
@@ -1158,10 +1460,6 @@ class MainWindow:
         plugins_list.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=plugins_list.yview)
         
-        # Add plugins to listbox
-        for plugin_id, plugin_info in plugins.items():
-            plugins_list.insert(tk.END, f"{plugin_info['name']} ({plugin_id})")
-            
         # Add details frame
         details_frame = ttk.LabelFrame(main_frame, text="Plugin Details", style="Modern.TLabelframe")
         details_frame.pack(fill=tk.X, pady=10)
@@ -1254,18 +1552,60 @@ class MainWindow:
             
         plugins_list.bind("<<ListboxSelect>>", on_plugin_select)
         
+        def reload_plugins():
+            """Refill the list from the current plugins and clear the details"""
+            nonlocal plugins, enabled_plugins
+            
+            # Get plugins list
+            plugins = self.app.plugin_manager.get_plugins()
+            enabled_plugins = self.app.settings.get("plugins", "enabled", [])
+            
+            # Add plugins to listbox
+            plugins_list.delete(0, tk.END)
+            for plugin_id, plugin_info in plugins.items():
+                plugins_list.insert(tk.END, f"{plugin_info['name']} ({plugin_id})")
+                
+            for var in (name_var, version_var, author_var, description_var):
+                var.set("")
+            enable_button.config(text="Enable", command="")
+            status_label.config(text="")
+            
+        reload_plugins()
+        self._reload_plugins_dialog = reload_plugins
+        
         # Close button
         ttk.Button(
             main_frame, 
             text="Close",
-            command=plugins_window.destroy
+            command=lambda: self._close_dialog(plugins_window)
         ).pack(side=tk.BOTTOM, pady=10)
         
+        self._show_dialog(plugins_window)
+        
+    def _show_dialog(self, dialog: tk.Toplevel) -> None:
+        """Show a dialog centred on the main window and make it modal
+        
+        Args:
+            dialog: Dialog window to show
+        """
         # Set window position relative to main window
-        plugins_window.update_idletasks()
-        x = self.window.winfo_x() + (self.window.winfo_width() - plugins_window.winfo_width()) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - plugins_window.winfo_height()) // 2
-        plugins_window.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dialog.update_idletasks()
+        x = self.window.winfo_x() + (self.window.winfo_width() - dialog.winfo_width()) // 2
+        y = self.window.winfo_y() + (self.window.winfo_height() - dialog.winfo_height()) // 2
+        dialog.geometry(f"+{max(0, x)}+{max(0, y)}")
+        
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        
+    def _close_dialog(self, dialog: tk.Toplevel) -> None:
+        """Hide a dialog so the next open can reuse it
+        
+        Args:
+            dialog: Dialog window to hide
+        """
+        dialog.grab_release()
+        dialog.withdraw()
         
     def refresh_content(self) -> None:
         """Refresh all content"""
@@ -1277,6 +1617,9 @@ class MainWindow:
         # Deiconify window if minimized
         self.window.deiconify()
         
+        # Pick up resolution changes made while hidden
+        self._screen_size = (self.window.winfo_screenwidth(), self.window.winfo_screenheight())
+        
         # Bring to front
         self.window.lift()
         self.window.focus_force()
@@ -1290,17 +1633,24 @@ class MainWindow:
         
         # Update state
         self.visible = True
+        self._update_clipboard_activity()
         
     def hide(self) -> None:
         """Hide the window"""
         self.window.withdraw()
         self.visible = False
+        self._update_clipboard_activity()
         
         # Cancel any pending collapse timer
         if self.collapse_timer:
             self.window.after_cancel(self.collapse_timer)
             self.collapse_timer = None
             
+    def _update_clipboard_activity(self) -> None:
+        """Let the clipboard manager poll quickly while any window is shown"""
+        windows = getattr(self.app, "windows", [self])
+        self.app.clipboard_manager.set_active(any(w.visible for w in windows))
+        
     def toggle_visibility(self) -> None:
         """Toggle window visibility"""
         if self.visible:
@@ -1319,6 +1669,8 @@ class MainWindow:
             self.window.after_cancel(self.collapse_timer)
             self.collapse_timer = None
             
+        self.app.theme_manager.remove_theme_change_listener(self._cache_theme)
+        
         # Remove from window list if needed
         if self in self.app.windows:
             self.app.windows.remove(self)
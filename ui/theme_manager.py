@@ -7,7 +7,7 @@ import logging
 import os
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -73,12 +73,44 @@ class ThemeManager:
         self.ttk_style = None
         self.root = None
         
+        # Bumped whenever the current theme or theme data changes, lets
+        # widgets skip re-styling when nothing changed
+        self.version = 0
+        self.theme_change_callbacks: Dict[Callable[[], None], None] = {}
+        
         # Ensure themes directory exists
         os.makedirs(themes_dir, exist_ok=True)
         
         # Load custom themes
         self._load_custom_themes()
         
+    def add_theme_change_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Add a callback to be notified when the theme changes
+        
+        Args:
+            callback: The function to call after a theme change
+        """
+        self.theme_change_callbacks[callback] = None
+        
+    def remove_theme_change_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Remove a previously added theme change listener
+        
+        Args:
+            callback: The callback function to remove
+        """
+        self.theme_change_callbacks.pop(callback, None)
+        
+    def _theme_changed(self) -> None:
+        """Bump the theme version and notify listeners"""
+        self.version += 1
+        for callback in list(self.theme_change_callbacks):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in theme change listener: {str(e)}")
+                
     def _load_custom_themes(self) -> None:
         """Load custom themes from theme directory"""
         try:
@@ -266,6 +298,7 @@ class ThemeManager:
         
         # Store current theme
         self.current_theme = theme_id
+        self._theme_changed()
         
         # If TTK style is not initialized, we're done
         if not self.ttk_style:
@@ -467,6 +500,7 @@ class ThemeManager:
             
         # Add to themes dictionary
         self.themes[theme_id] = theme_data
+        self._theme_changed()
         
         # Save to file
         try:
@@ -497,6 +531,7 @@ class ThemeManager:
         # Remove from themes dictionary
         if theme_id in self.themes:
             del self.themes[theme_id]
+            self._theme_changed()
             
         # Delete file if it exists
         theme_file = os.path.join(self.themes_dir, f"{theme_id}.json")